@@ -2,13 +2,20 @@
 API dependencies for dependency injection.
 Provides service instances and authentication.
 """
-from typing import Annotated
+from typing import Annotated, Optional, Tuple
+import asyncio
+import hashlib
+import time
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from jose import JWTError, jwt
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from starlette.datastructures import State
 
-from app.core.dependencies import get_database
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.dependencies import get_db
 from app.core.security import decode_token
 from app.core.exceptions import AuthenticationError, ForbiddenError
 from app.domain.users.entities import User
@@ -17,7 +24,7 @@ from app.infrastructure.repositories.user_repository import MongoUserRepository
 from app.infrastructure.repositories.product_repository import MongoProductRepository
 from app.infrastructure.repositories.order_repository import MongoOrderRepository
 from app.services.auth_service import AuthService
-from app.services.user_service import UserService
+from app.services.user_service import UserService, user_generations
 from app.services.product_service import ProductService
 from app.services.order_service import OrderService
 from app.services.payment_service import PaymentService
@@ -25,65 +32,167 @@ from app.services.payment_service import PaymentService
 # Security scheme
 security = HTTPBearer()
 
+# Shared by every 401 raised below
+_UNAUTHORIZED = status.HTTP_401_UNAUTHORIZED
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+# Repositories and services are stateless wrappers around the shared Motor
+# database handle, so one instance of each is built per application and
+# kept on app.state instead of being reconstructed on every request.
+def init_services(app: FastAPI, database: Optional[AsyncIOMotorDatabase] = None) -> None:
+    """
+    Build repository and service singletons and attach them to app.state.
+
+    Args:
+        app: FastAPI application
+        database: Database handle; defaults to the shared connection
+    """
+    database = database if database is not None else get_db()
+    state = app.state
+
+    state.user_repository = MongoUserRepository(database)
+    state.product_repository = MongoProductRepository(database)
+    state.order_repository = MongoOrderRepository(database)
+
+    state.auth_service = AuthService(state.user_repository)
+    state.user_service = UserService(state.user_repository)
+    state.product_service = ProductService(state.product_repository)
+    state.order_service = OrderService(state.order_repository, state.product_repository)
+    state.payment_service = PaymentService()
+
+
+_SERVICE_ATTRS = (
+    "user_repository",
+    "product_repository",
+    "order_repository",
+    "auth_service",
+    "user_service",
+    "product_service",
+    "order_service",
+    "payment_service",
+)
+
+
+def reset_services(app: FastAPI) -> None:
+    """Drop service singletons, e.g. after the database connection closes."""
+    for name in _SERVICE_ATTRS:
+        if hasattr(app.state, name):
+            delattr(app.state, name)
+
+
+def _app_state(request: Request) -> State:
+    """Return app.state, building singletons lazily if startup was skipped."""
+    state = request.app.state
+    if getattr(state, "payment_service", None) is None:
+        init_services(request.app)
+    return state
+
 
 # Repository dependencies
-async def get_user_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database)
-) -> MongoUserRepository:
+async def get_user_repository(request: Request) -> MongoUserRepository:
     """Get user repository instance."""
-    return MongoUserRepository(db)
+    return _app_state(request).user_repository
 
 
-async def get_product_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database)
-) -> MongoProductRepository:
+async def get_product_repository(request: Request) -> MongoProductRepository:
     """Get product repository instance."""
-    return MongoProductRepository(db)
+    return _app_state(request).product_repository
 
 
-async def get_order_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database)
-) -> MongoOrderRepository:
+async def get_order_repository(request: Request) -> MongoOrderRepository:
     """Get order repository instance."""
-    return MongoOrderRepository(db)
+    return _app_state(request).order_repository
 
 
 # Service dependencies
-async def get_auth_service(
-    user_repo: MongoUserRepository = Depends(get_user_repository)
-) -> AuthService:
+async def get_auth_service(request: Request) -> AuthService:
     """Get auth service instance."""
-    return AuthService(user_repo)
+    return _app_state(request).auth_service
 
 
-async def get_user_service(
-    user_repo: MongoUserRepository = Depends(get_user_repository)
-) -> UserService:
+async def get_user_service(request: Request) -> UserService:
     """Get user service instance."""
-    return UserService(user_repo)
+    return _app_state(request).user_service
 
 
-async def get_product_service(
-    product_repo: MongoProductRepository = Depends(get_product_repository)
-) -> ProductService:
+async def get_product_service(request: Request) -> ProductService:
     """Get product service instance."""
-    return ProductService(product_repo)
+    return _app_state(request).product_service
 
 
-async def get_order_service(
-    order_repo: MongoOrderRepository = Depends(get_order_repository),
-    product_repo: MongoProductRepository = Depends(get_product_repository)
-) -> OrderService:
+async def get_order_service(request: Request) -> OrderService:
     """Get order service instance."""
-    return OrderService(order_repo, product_repo)
+    return _app_state(request).order_service
 
 
-async def get_payment_service() -> PaymentService:
+async def get_payment_service(request: Request) -> PaymentService:
     """Get payment service instance."""
-    return PaymentService()
+    return _app_state(request).payment_service
 
 
 # Authentication dependencies
+
+# Recently verified tokens, keyed by token hash, with the user's generation
+# at lookup time. Entries never outlive the token itself and are kept short;
+# user writes bump the generation, which makes older entries misses.
+_auth_cache: TTLCache[Tuple[int, User]] = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+# In-flight lookups, so concurrent misses for one token share a single query
+_pending_auth: dict[str, "asyncio.Task[User]"] = {}
+
+
+def _token_key(token: str) -> str:
+    """Cache key for a bearer token; avoids keeping raw tokens in memory."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+async def _authenticate(token: str, auth_service: AuthService) -> User:
+    """Verify a token against the database and cache the resulting user."""
+    try:
+        claims = jwt.get_unverified_claims(token)
+    except JWTError:
+        claims = {}
+    # Read before the lookup, so a write racing it leaves the entry stale
+    generation = user_generations.get(claims.get("sub"))
+
+    user = await auth_service.get_current_user(token)
+
+    expires_at = claims.get("exp")
+    ttl = min(settings.AUTH_CACHE_TTL_SECONDS, expires_at - time.time()) if expires_at else 0
+    _auth_cache.set(_token_key(token), (generation, user), ttl=ttl)
+
+    return user
+
+
+async def _resolve_user(token: str, auth_service: AuthService) -> User:
+    """Return the user for a bearer token, raising 401 if it is invalid."""
+    key = _token_key(token)
+
+    cached = _auth_cache.get(key)
+    if cached is not None:
+        generation, user = cached
+        if generation == user_generations.get(user.id):
+            return user
+
+    pending = _pending_auth.get(key)
+    if pending is None:
+        pending = asyncio.create_task(_authenticate(token, auth_service))
+        _pending_auth[key] = pending
+        pending.add_done_callback(lambda _: _pending_auth.pop(key, None))
+
+    try:
+        return await asyncio.shield(pending)
+    except AuthenticationError as e:
+        raise HTTPException(
+            status_code=_UNAUTHORIZED,
+            detail=str(e),
+            headers=_BEARER_HEADERS
+        )
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthService = Depends(get_auth_service)
@@ -92,26 +201,44 @@ async def get_current_user(
     Get current authenticated user.
 
     Extracts JWT from Authorization header and returns user.
+    Verified users are cached briefly by token hash.
     """
-    try:
-        user = await auth_service.get_current_user(credentials.credentials)
-        return user
-    except AuthenticationError as e:
+    return await _resolve_user(credentials.credentials, auth_service)
+
+
+async def get_current_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """
+    Get verified JWT claims without loading the user.
+
+    For endpoints that only need to know the caller holds a valid token.
+    """
+    payload = decode_token(credentials.credentials)
+
+    if not payload or not payload.get("sub"):
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"}
+            status_code=_UNAUTHORIZED,
+            detail="Invalid token",
+            headers=_BEARER_HEADERS
         )
 
+    return payload
+
 
 async def get_current_admin(
-    user: User = Depends(get_current_user)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> User:
     """
     Get current user and verify admin role.
 
+    Resolves the user directly rather than through get_current_user so
+    admin routes carry a single authentication node in the dependency graph.
+
     Raises 403 if user is not admin.
     """
+    user = await _resolve_user(credentials.credentials, auth_service)
     if not user.is_admin():
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -123,8 +250,13 @@ async def get_current_admin(
 # Type aliases for cleaner annotations
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentAdmin = Annotated[User, Depends(get_current_admin)]
+CurrentClaims = Annotated[dict, Depends(get_current_claims)]
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 ProductServiceDep = Annotated[ProductService, Depends(get_product_service)]
 OrderServiceDep = Annotated[OrderService, Depends(get_order_service)]
 PaymentServiceDep = Annotated[PaymentService, Depends(get_payment_service)]
+
+# Shared pagination query parameters
+PageQuery = Annotated[int, Query(ge=1)]
+LimitQuery = Annotated[int, Query(ge=1, le=100)]
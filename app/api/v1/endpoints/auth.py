@@ -3,7 +3,7 @@ Authentication endpoints.
 """
 from fastapi import APIRouter, HTTPException, status
 
-from app.api.v1.dependencies import AuthServiceDep, CurrentUser
+from app.api.v1.dependencies import AuthServiceDep, CurrentUser, CurrentClaims
 from app.api.v1.schemas.auth import (
     LoginRequest,
     RegisterRequest,
@@ -181,12 +181,13 @@ async def change_password(
 
 
 @router.post("/logout", response_model=MessageResponse)
-async def logout(current_user: CurrentUser):
+async def logout(claims: CurrentClaims):
     """
     Logout user.
 
     With JWT, logout is handled client-side by removing the token.
-    This endpoint is for API consistency.
+    This endpoint is for API consistency, so it only verifies the token
+    and does not load the user.
     """
     return MessageResponse(
         message="Logged out successfully"
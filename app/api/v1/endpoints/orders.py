@@ -1,13 +1,20 @@
 """
 Order endpoints.
 """
-from math import ceil
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
-from app.api.v1.dependencies import OrderServiceDep, CurrentUser, CurrentAdmin
+from app.api.v1.dependencies import (
+    get_current_admin,
+    OrderServiceDep,
+    CurrentUser,
+    PageQuery,
+    LimitQuery,
+)
 from app.api.v1.schemas.orders import (
     OrderResponse,
     OrderCreateRequest,
@@ -23,21 +30,35 @@ from app.core.exceptions import NotFoundError, ValidationError, ForbiddenError
 
 router = APIRouter()
 
+# Admin routes share one authorization check, attached at the router level
+admin_router = APIRouter(prefix="/admin", dependencies=[Depends(get_current_admin)])
+
+# Dumps a whole item list in one pydantic-core call
+_ORDER_ITEMS_ADAPTER = TypeAdapter(List[OrderItemSchema])
+
 
 def order_to_response(order) -> OrderResponse:
-    """Convert order entity to response schema."""
-    return OrderResponse(
+    """
+    Convert order entity to response schema.
+
+    Entities are already validated, so the schemas are built with
+    model_construct to skip a second validation pass.
+    """
+    shipping = order.shipping_info
+    payment = order.payment_info
+
+    return OrderResponse.model_construct(
         id=order.id,
         user=order.user,
-        shipping_info=ShippingInfoSchema(
-            address=order.shipping_info.address,
-            city=order.shipping_info.city,
-            country=order.shipping_info.country,
-            postal_code=order.shipping_info.postal_code,
-            phone_no=order.shipping_info.phone_no
+        shipping_info=ShippingInfoSchema.model_construct(
+            address=shipping.address,
+            city=shipping.city,
+            country=shipping.country,
+            postal_code=shipping.postal_code,
+            phone_no=shipping.phone_no
         ),
         order_items=[
-            OrderItemSchema(
+            OrderItemSchema.model_construct(
                 product=item.product,
                 name=item.name,
                 price=float(item.price),
@@ -50,10 +71,10 @@ def order_to_response(order) -> OrderResponse:
         tax_price=float(order.tax_price),
         shipping_price=float(order.shipping_price),
         total_price=float(order.total_price),
-        payment_info=PaymentInfoSchema(
-            id=order.payment_info.id,
-            status=order.payment_info.status
-        ) if order.payment_info else None,
+        payment_info=PaymentInfoSchema.model_construct(
+            id=payment.id,
+            status=payment.status
+        ) if payment else None,
         paid_at=order.paid_at,
         delivered_at=order.delivered_at,
         order_status=order.order_status.value,
@@ -76,7 +97,7 @@ async def create_order(
         order = await order_service.create_order(
             user_id=current_user.id,
             shipping_info=request.shipping_info.model_dump(),
-            order_items=[item.model_dump() for item in request.order_items],
+            order_items=_ORDER_ITEMS_ADAPTER.dump_python(request.order_items),
             items_price=request.items_price,
             tax_price=request.tax_price,
             shipping_price=request.shipping_price,
@@ -92,12 +113,14 @@ async def create_order(
         )
 
 
-@router.get("/me", response_model=OrderListResponse)
+# List endpoints return ORJSONResponse directly, skipping response_model
+# validation and jsonable_encoder; the payload is built from trusted entities.
+@router.get("/me", responses={200: {"model": OrderListResponse}})
 async def get_my_orders(
     current_user: CurrentUser,
     order_service: OrderServiceDep,
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=100)
+    page: PageQuery = 1,
+    limit: LimitQuery = 10
 ):
     """
     Get current user's orders.
@@ -108,13 +131,13 @@ async def get_my_orders(
         limit=limit
     )
 
-    return OrderListResponse(
+    return ORJSONResponse(OrderListResponse.model_construct(
         count=len(orders),
         total=total,
         page=page,
-        pages=ceil(total / limit) if total > 0 else 1,
+        pages=-(-total // limit) if total else 1,
         orders=[order_to_response(o) for o in orders]
-    )
+    ).model_dump())
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -178,31 +201,29 @@ async def cancel_order(
 
 # Admin endpoints
 
-@router.get("/admin/orders", response_model=OrderListResponse)
+@admin_router.get("/orders", responses={200: {"model": OrderListResponse}})
 async def get_all_orders(
-    current_admin: CurrentAdmin,
     order_service: OrderServiceDep,
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=100)
+    page: PageQuery = 1,
+    limit: LimitQuery = 10
 ):
     """
     Get all orders (admin only).
     """
     orders, total = await order_service.get_all_orders(page, limit)
 
-    return OrderListResponse(
+    return ORJSONResponse(OrderListResponse.model_construct(
         count=len(orders),
         total=total,
         page=page,
-        pages=ceil(total / limit) if total > 0 else 1,
+        pages=-(-total // limit) if total else 1,
         orders=[order_to_response(o) for o in orders]
-    )
+    ).model_dump())
 
 
-@router.get("/admin/order/{order_id}", response_model=OrderResponse)
+@admin_router.get("/order/{order_id}", response_model=OrderResponse)
 async def admin_get_order(
     order_id: str,
-    current_admin: CurrentAdmin,
     order_service: OrderServiceDep
 ):
     """
@@ -219,11 +240,10 @@ async def admin_get_order(
         )
 
 
-@router.put("/admin/order/{order_id}", response_model=OrderResponse)
+@admin_router.put("/order/{order_id}", response_model=OrderResponse)
 async def update_order_status(
     order_id: str,
     request: OrderStatusUpdateRequest,
-    current_admin: CurrentAdmin,
     order_service: OrderServiceDep
 ):
     """
@@ -245,10 +265,9 @@ async def update_order_status(
         )
 
 
-@router.put("/admin/order/{order_id}/deliver", response_model=OrderResponse)
+@admin_router.put("/order/{order_id}/deliver", response_model=OrderResponse)
 async def mark_order_delivered(
     order_id: str,
-    current_admin: CurrentAdmin,
     order_service: OrderServiceDep
 ):
     """
@@ -270,9 +289,8 @@ async def mark_order_delivered(
         )
 
 
-@router.get("/admin/stats", response_model=SalesStatsResponse)
+@admin_router.get("/stats", response_model=SalesStatsResponse)
 async def get_sales_stats(
-    current_admin: CurrentAdmin,
     order_service: OrderServiceDep,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None
@@ -290,3 +308,6 @@ async def get_sales_stats(
         processing_orders=stats.get("processing_orders", 0),
         cancelled_orders=stats.get("cancelled_orders", 0)
     )
+
+
+router.include_router(admin_router)
@@ -1,14 +1,23 @@
 """
 Product endpoints.
 """
-from math import ceil
-from typing import Optional
-
-from fastapi import APIRouter, HTTPException, status, Query
-
-from app.api.v1.dependencies import ProductServiceDep, CurrentUser, CurrentAdmin
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.api.v1.dependencies import (
+    get_current_admin,
+    ProductServiceDep,
+    CurrentUser,
+    CurrentAdmin,
+    PageQuery,
+    LimitQuery,
+)
 from app.api.v1.schemas.products import (
     ProductResponse,
+    ProductSummaryResponse,
     ProductCreateRequest,
     ProductUpdateRequest,
     ProductListResponse,
@@ -16,27 +25,43 @@ from app.api.v1.schemas.products import (
     ProductImageSchema,
     ProductReviewSchema,
 )
+from app.api.v1.responses import etag_response
 from app.api.v1.schemas.common import MessageResponse
 from app.core.exceptions import NotFoundError
 
 router = APIRouter()
 
+# Admin routes share one authorization check, attached at the router level
+admin_router = APIRouter(prefix="/admin", dependencies=[Depends(get_current_admin)])
+
+# Dumps a whole image list in one pydantic-core call
+_PRODUCT_IMAGES_ADAPTER = TypeAdapter(List[ProductImageSchema])
+
+# Legacy page size parameter name used by the storefront
+ResPerPageQuery = Annotated[int, Query(ge=1, le=100, alias="resPerPage")]
+
 
 def product_to_response(product) -> ProductResponse:
-    """Convert product entity to response schema."""
-    return ProductResponse(
+    """
+    Convert product entity to response schema.
+
+    Entities are already validated, so the schemas are built with
+    model_construct to skip a second validation pass. Prices are whole
+    units, as the create and update requests accept them.
+    """
+    return ProductResponse.model_construct(
         id=product.id,
         name=product.name,
-        price=float(product.price),
+        price=product.price_cents // 100,
         description=product.description,
         ratings=product.ratings,
-        images=[ProductImageSchema(image=img.image) for img in product.images],
+        images=[ProductImageSchema.model_construct(image=img.image) for img in product.images],
         category=product.category.value,
         seller=product.seller,
         stock=product.stock,
         num_of_reviews=product.num_of_reviews,
         reviews=[
-            ProductReviewSchema(
+            ProductReviewSchema.model_construct(
                 user=r.user,
                 rating=r.rating,
                 comment=r.comment
@@ -48,16 +73,38 @@ def product_to_response(product) -> ProductResponse:
     )
 
 
-@router.get("", response_model=ProductListResponse)
+def product_to_summary_response(product) -> ProductSummaryResponse:
+    """Convert product entity to the listing schema (no reviews)."""
+    return ProductSummaryResponse.model_construct(
+        id=product.id,
+        name=product.name,
+        price=product.price_cents // 100,
+        description=product.description,
+        ratings=product.ratings,
+        images=[ProductImageSchema.model_construct(image=img.image) for img in product.images],
+        category=product.category.value,
+        seller=product.seller,
+        stock=product.stock,
+        num_of_reviews=product.num_of_reviews,
+        user=product.user,
+        created_at=product.created_at
+    )
+
+
+# List endpoints return ORJSONResponse directly, skipping response_model
+# validation and jsonable_encoder; the payload is built from trusted entities.
+# Public reads carry an ETag so clients can revalidate with If-None-Match.
+@router.get("", responses={200: {"model": ProductListResponse}, 304: {}})
 async def get_products(
+    request: Request,
     product_service: ProductServiceDep,
     keyword: Optional[str] = None,
     category: Optional[str] = None,
     min_price: Optional[float] = Query(None, alias="price[gte]", ge=0),
     max_price: Optional[float] = Query(None, alias="price[lte]", ge=0),
     min_rating: Optional[float] = Query(None, alias="ratings[gte]", ge=0, le=5),
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=100, alias="resPerPage")
+    page: PageQuery = 1,
+    limit: ResPerPageQuery = 10
 ):
     """
     Get products with filtering and pagination.
@@ -79,18 +126,19 @@ async def get_products(
         limit=limit
     )
 
-    return ProductListResponse(
+    return etag_response(request, ProductListResponse.model_construct(
         count=len(products),
         total=total,
         page=page,
-        pages=ceil(total / limit) if total > 0 else 1,
+        pages=-(-total // limit) if total else 1,
         results_per_page=limit,
-        products=[product_to_response(p) for p in products]
-    )
+        products=[product_to_summary_response(p) for p in products]
+    ).model_dump())
 
 
-@router.get("/{product_id}", response_model=ProductResponse)
+@router.get("/{product_id}", responses={200: {"model": ProductResponse}, 304: {}})
 async def get_product(
+    request: Request,
     product_id: str,
     product_service: ProductServiceDep
 ):
@@ -99,7 +147,7 @@ async def get_product(
     """
     try:
         product = await product_service.get_product(product_id)
-        return product_to_response(product)
+        return etag_response(request, product_to_response(product).model_dump())
 
     except NotFoundError as e:
         raise HTTPException(
@@ -160,29 +208,28 @@ async def delete_review(
 
 # Admin endpoints
 
-@router.get("/admin/products", response_model=ProductListResponse)
+@admin_router.get("/products", responses={200: {"model": ProductListResponse}})
 async def get_admin_products(
-    current_admin: CurrentAdmin,
     product_service: ProductServiceDep,
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=100)
+    page: PageQuery = 1,
+    limit: LimitQuery = 10
 ):
     """
     Get all products for admin.
     """
     products, total = await product_service.get_admin_products(page, limit)
 
-    return ProductListResponse(
+    return ORJSONResponse(ProductListResponse.model_construct(
         count=len(products),
         total=total,
         page=page,
-        pages=ceil(total / limit) if total > 0 else 1,
+        pages=-(-total // limit) if total else 1,
         results_per_page=limit,
-        products=[product_to_response(p) for p in products]
-    )
+        products=[product_to_summary_response(p) for p in products]
+    ).model_dump())
 
 
-@router.post("/admin/product/new", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
+@admin_router.post("/product/new", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
     request: ProductCreateRequest,
     current_admin: CurrentAdmin,
@@ -198,18 +245,17 @@ async def create_product(
         category=request.category,
         seller=request.seller,
         stock=request.stock,
-        images=[img.model_dump() for img in request.images],
+        images=_PRODUCT_IMAGES_ADAPTER.dump_python(request.images),
         user_id=current_admin.id
     )
 
     return product_to_response(product)
 
 
-@router.put("/admin/product/{product_id}", response_model=ProductResponse)
+@admin_router.put("/product/{product_id}", response_model=ProductResponse)
 async def update_product(
     product_id: str,
     request: ProductUpdateRequest,
-    current_admin: CurrentAdmin,
     product_service: ProductServiceDep
 ):
     """
@@ -224,7 +270,7 @@ async def update_product(
             category=request.category,
             seller=request.seller,
             stock=request.stock,
-            images=[img.model_dump() for img in request.images] if request.images else None
+            images=_PRODUCT_IMAGES_ADAPTER.dump_python(request.images) if request.images else None
         )
 
         return product_to_response(product)
@@ -236,10 +282,9 @@ async def update_product(
         )
 
 
-@router.delete("/admin/product/{product_id}", response_model=MessageResponse)
+@admin_router.delete("/product/{product_id}", response_model=MessageResponse)
 async def delete_product(
     product_id: str,
-    current_admin: CurrentAdmin,
     product_service: ProductServiceDep
 ):
     """
@@ -255,3 +300,6 @@ async def delete_product(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+
+
+router.include_router(admin_router)
@@ -1,43 +1,82 @@
 """
 User management endpoints.
 """
-from math import ceil
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, Request, Response, UploadFile, File
 
-from app.api.v1.dependencies import UserServiceDep, CurrentUser, CurrentAdmin
+from app.api.v1.dependencies import (
+    get_current_admin,
+    UserServiceDep,
+    CurrentUser,
+    PageQuery,
+    LimitQuery,
+)
+from app.api.v1.responses import PydanticResponse, etag_response
 from app.api.v1.schemas.users import (
     UserResponse,
+    UserListResponse,
     UserUpdateRequest,
     AdminUserUpdateRequest,
 )
 from app.api.v1.schemas.common import MessageResponse
-from app.core.exceptions import NotFoundError, ConflictError
+from app.services.user_service import encode_user_cursor
 
+# Service errors (NotFoundError, ConflictError, ValidationError) are not
+# caught here; the AppException handler renders them with their own status.
 router = APIRouter()
 
+# Admin routes share one authorization check, attached at the router level
+admin_router = APIRouter(prefix="/admin", dependencies=[Depends(get_current_admin)])
+
+# Endpoints return responses directly, so schemas are declared under
+# responses= for OpenAPI instead of as response_model.
+_USER_RESPONSES = {200: {"model": UserResponse}}
+_MESSAGE_RESPONSES = {200: {"model": MessageResponse}}
+
+# Admin user detail may be reused by the admin's browser, never by shared caches
+_ADMIN_USER_CACHE_CONTROL = "private, max-age=30"
+
+# Fixed-message bodies, rendered once. Each request still gets its own
+# Response, since middleware appends headers to the response it sends.
+_AVATAR_UPDATED_BODY = MessageResponse(message="Avatar updated successfully").model_dump_json().encode()
+_USER_DELETED_BODY = MessageResponse(message="User deleted successfully").model_dump_json().encode()
 
-@router.get("/profile", response_model=UserResponse)
+
+def user_to_response(user) -> UserResponse:
+    """
+    Convert user entity to response schema.
+
+    Entities are already validated, so the schema is built with
+    model_construct to skip a second validation pass.
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        avatar=user.avatar,
+        role=user.role.value,
+        created_at=user.created_at
+    )
+
+
+@router.get("/profile", responses={**_USER_RESPONSES, 304: {}})
 async def get_profile(
+    request: Request,
     current_user: CurrentUser,
     user_service: UserServiceDep
 ):
     """
     Get current user's profile.
+
+    Supports conditional requests via ETag/If-None-Match.
     """
-    profile = await user_service.get_user_profile(current_user.id)
+    user = await user_service.get_profile(current_user.id)
 
-    return UserResponse(
-        id=profile["id"],
-        name=profile["name"],
-        email=profile["email"],
-        avatar=profile.get("avatar"),
-        role=profile["role"],
-        created_at=profile.get("created_at")
-    )
+    return etag_response(request, user_to_response(user))
 
 
-@router.put("/profile", response_model=UserResponse)
+@router.put("/profile", responses=_USER_RESPONSES)
 async def update_profile(
     request: UserUpdateRequest,
     current_user: CurrentUser,
@@ -46,31 +85,17 @@ async def update_profile(
     """
     Update current user's profile.
     """
-    try:
-        updated_user = await user_service.update_profile(
-            user_id=current_user.id,
-            name=request.name,
-            email=request.email,
-            avatar=request.avatar
-        )
-
-        return UserResponse(
-            id=updated_user.id,
-            name=updated_user.name,
-            email=updated_user.email,
-            avatar=updated_user.avatar,
-            role=updated_user.role.value,
-            created_at=updated_user.created_at
-        )
-
-    except ConflictError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-
-
-@router.put("/avatar", response_model=MessageResponse)
+    updated_user = await user_service.update_profile(
+        user_id=current_user.id,
+        name=request.name,
+        email=request.email,
+        avatar=request.avatar
+    )
+
+    return PydanticResponse(user_to_response(updated_user))
+
+
+@router.put("/avatar", responses=_MESSAGE_RESPONSES)
 async def update_avatar(
     avatar: str,
     current_user: CurrentUser,
@@ -81,129 +106,108 @@ async def update_avatar(
     """
     await user_service.update_avatar(current_user.id, avatar)
 
-    return MessageResponse(message="Avatar updated successfully")
+    return Response(content=_AVATAR_UPDATED_BODY, media_type="application/json")
 
 
 # Admin endpoints
 
-@router.get("/admin/users")
+# The list envelope is built from raw rows and rendered by orjson in one
+# pass; UserListResponse documents its shape.
+@admin_router.get("/users", responses={200: {"model": UserListResponse}, 304: {}})
 async def get_all_users(
-    current_admin: CurrentAdmin,
+    request: Request,
     user_service: UserServiceDep,
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=100)
+    page: PageQuery = 1,
+    limit: LimitQuery = 10,
+    cursor: Optional[str] = None
 ):
     """
     Get all users (admin only).
+
+    Pass the returned next_cursor back as cursor to page through the
+    list without skip offsets; page is ignored when a cursor is given.
+    Supports conditional requests via ETag/If-None-Match.
     """
+    if cursor:
+        users, next_cursor = await user_service.get_users_after(cursor, limit)
+
+        return etag_response(request, {
+            "success": True,
+            "count": len(users),
+            "next_cursor": next_cursor,
+            "users": users
+        })
+
     users, total = await user_service.get_all_users(
         skip=(page - 1) * limit,
         limit=limit
     )
 
-    return {
+    return etag_response(request, {
         "success": True,
         "count": len(users),
         "total": total,
         "page": page,
-        "pages": ceil(total / limit) if total > 0 else 1,
-        "users": [
-            UserResponse(
-                id=user.id,
-                name=user.name,
-                email=user.email,
-                avatar=user.avatar,
-                role=user.role.value,
-                created_at=user.created_at
-            )
-            for user in users
-        ]
-    }
-
-
-@router.get("/admin/user/{user_id}", response_model=UserResponse)
+        "pages": -(-total // limit) if total else 1,
+        "next_cursor": (
+            encode_user_cursor(users[-1])
+            if users and page * limit < total else None
+        ),
+        "users": users
+    })
+
+
+@admin_router.get("/user/{user_id}", responses={**_USER_RESPONSES, 304: {}})
 async def get_user(
+    request: Request,
     user_id: str,
-    current_admin: CurrentAdmin,
     user_service: UserServiceDep
 ):
     """
     Get user by ID (admin only).
-    """
-    try:
-        user = await user_service.get_user_by_id(user_id)
 
-        return UserResponse(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            avatar=user.avatar,
-            role=user.role.value,
-            created_at=user.created_at
-        )
+    Browsers may reuse the response privately for a short while and
+    revalidate it via ETag/If-None-Match afterwards.
+    """
+    user = await user_service.get_user_by_id(user_id)
 
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    return etag_response(
+        request,
+        user_to_response(user),
+        cache_control=_ADMIN_USER_CACHE_CONTROL
+    )
 
 
-@router.put("/admin/user/{user_id}", response_model=UserResponse)
+@admin_router.put("/user/{user_id}", responses=_USER_RESPONSES)
 async def admin_update_user(
     user_id: str,
     request: AdminUserUpdateRequest,
-    current_admin: CurrentAdmin,
     user_service: UserServiceDep
 ):
     """
     Update user by ID (admin only).
     """
-    try:
-        updated_user = await user_service.admin_update_user(
-            user_id=user_id,
-            name=request.name,
-            email=request.email,
-            role=request.role
-        )
-
-        return UserResponse(
-            id=updated_user.id,
-            name=updated_user.name,
-            email=updated_user.email,
-            avatar=updated_user.avatar,
-            role=updated_user.role.value,
-            created_at=updated_user.created_at
-        )
-
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ConflictError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-
-
-@router.delete("/admin/user/{user_id}", response_model=MessageResponse)
+    updated_user = await user_service.admin_update_user(
+        user_id=user_id,
+        name=request.name,
+        email=request.email,
+        role=request.role
+    )
+
+    return PydanticResponse(user_to_response(updated_user))
+
+
+@admin_router.delete("/user/{user_id}", responses=_MESSAGE_RESPONSES)
 async def delete_user(
     user_id: str,
-    current_admin: CurrentAdmin,
     user_service: UserServiceDep
 ):
     """
     Delete user by ID (admin only).
     """
-    try:
-        await user_service.delete_user(user_id)
+    await user_service.delete_user(user_id)
+
+    return Response(content=_USER_DELETED_BODY, media_type="application/json")
 
-        return MessageResponse(message="User deleted successfully")
 
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+router.include_router(admin_router)
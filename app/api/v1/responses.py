@@ -0,0 +1,69 @@
+"""
+Response helpers for API endpoints.
+"""
+from hashlib import blake2b
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response rendered straight from a Pydantic model.
+
+    Endpoints returning this skip response_model validation and
+    jsonable_encoder; pydantic-core serializes the model to bytes directly.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        """Serialize the model to JSON bytes."""
+        return content.model_dump_json().encode("utf-8")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def etag_response(
+    request: Request,
+    content: Any,
+    cache_control: Optional[str] = None
+) -> Response:
+    """
+    Render JSON content with an ETag, or 304 if the client has it already.
+
+    The ETag is a hash of the rendered body, so it changes whenever any
+    field in the payload does.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        content: Pydantic model or JSON-serializable payload
+        cache_control: Optional Cache-Control header value
+
+    Returns:
+        200 response with the body, or an empty 304 response
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json().encode("utf-8")
+    else:
+        body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'W/"{blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -11,11 +11,13 @@ from app.api.v1.schemas.auth import (
 )
 from app.api.v1.schemas.users import (
     UserResponse,
+    UserListResponse,
     UserUpdateRequest,
     PasswordUpdateRequest,
 )
 from app.api.v1.schemas.products import (
     ProductResponse,
+    ProductSummaryResponse,
     ProductCreateRequest,
     ProductUpdateRequest,
     ProductListResponse,
@@ -40,10 +42,12 @@ __all__ = [
     "ResetPasswordRequest",
     # Users
     "UserResponse",
+    "UserListResponse",
     "UserUpdateRequest",
     "PasswordUpdateRequest",
     # Products
     "ProductResponse",
+    "ProductSummaryResponse",
     "ProductCreateRequest",
     "ProductUpdateRequest",
     "ProductListResponse",
@@ -1,8 +1,8 @@
 """
 Authentication request/response schemas.
 """
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated, Optional
+from pydantic import BaseModel, EmailStr, Field, StringConstraints
 
 
 class LoginRequest(BaseModel):
@@ -13,7 +13,8 @@ class LoginRequest(BaseModel):
 
 class RegisterRequest(BaseModel):
     """User registration data."""
-    name: str = Field(..., min_length=1, max_length=100)
+    # Passwords are taken as typed; only the name is stripped
+    name: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
     email: EmailStr
     password: str = Field(..., min_length=6)
     avatar: Optional[str] = None
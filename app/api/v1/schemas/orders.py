@@ -4,13 +4,15 @@ Order request/response schemas.
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.orders.value_objects import OrderStatus
 
 
 class ShippingInfoSchema(BaseModel):
     """Shipping information schema."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     address: str = Field(..., min_length=1)
     city: str = Field(..., min_length=1)
     country: str = Field(..., min_length=1)
@@ -26,6 +28,8 @@ class PaymentInfoSchema(BaseModel):
 
 class OrderItemSchema(BaseModel):
     """Order item schema."""
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     product: str
     name: str
     price: float
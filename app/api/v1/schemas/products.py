@@ -4,13 +4,15 @@ Product request/response schemas.
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.products.value_objects import ProductCategory
 
 
 class ProductImageSchema(BaseModel):
     """Product image schema."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     image: str
 
 
@@ -39,10 +41,29 @@ class ProductResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+
+
+class ProductSummaryResponse(BaseModel):
+    """Product data for listing views; reviews are not included."""
+    id: str
+    name: str
+    price: int
+    description: str
+    ratings: float
+    images: List[ProductImageSchema]
+    category: str
+    seller: str
+    stock: int
+    num_of_reviews: int
+    user: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 
 class ProductCreateRequest(BaseModel):
     """Product creation request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: str = Field(..., min_length=1, max_length=100)
     price: int = Field(..., ge=0)
     description: str = Field(..., min_length=1)
@@ -54,6 +75,8 @@ class ProductCreateRequest(BaseModel):
 
 class ProductUpdateRequest(BaseModel):
     """Product update request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     price: Optional[int] = Field(None, ge=0)
     description: Optional[str] = None
@@ -71,11 +94,13 @@ class ProductListResponse(BaseModel):
     page: int
     pages: int
     results_per_page: int
-    products: List[ProductResponse]
+    products: List[ProductSummaryResponse]
 
 
 class ReviewCreateRequest(BaseModel):
     """Create product review request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     rating: float = Field(..., ge=0, le=5)
     comment: str = Field(..., min_length=1)
 
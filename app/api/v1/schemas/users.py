@@ -1,26 +1,46 @@
 """
 User request/response schemas.
 """
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserResponse(BaseModel):
     """User data for API responses."""
     id: str
     name: str
-    email: EmailStr
+    # Stored emails were validated on write; EmailStr stays on request schemas
+    email: str
     avatar: Optional[str] = None
     role: str
     created_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+        frozen = True
+
+
+class UserListResponse(BaseModel):
+    """
+    Admin user list response.
+
+    total, page and pages are only set for page-based requests;
+    next_cursor is null on the last page.
+    """
+    success: bool = True
+    count: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    users: List[UserResponse]
 
 
 class UserUpdateRequest(BaseModel):
     """User profile update request."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     email: Optional[EmailStr] = None
     avatar: Optional[str] = None
@@ -34,6 +54,8 @@ class PasswordUpdateRequest(BaseModel):
 
 class AdminUserUpdateRequest(BaseModel):
     """Admin user update (includes role)."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     email: Optional[EmailStr] = None
     role: Optional[str] = None
@@ -0,0 +1,92 @@
+"""
+In-process caching utilities.
+
+Small, dependency-free caches for hot read paths. Entries live in the
+worker process only, so every cache here must tolerate short staleness.
+"""
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache with per-entry expiry.
+
+    Not thread-safe; intended for use from the event loop thread.
+
+    Args:
+        maxsize: Maximum number of entries before the least recently
+            used one is evicted
+        ttl: Default time-to-live in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Return a live entry and mark it as recently used."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store an entry, optionally overriding the default TTL."""
+        ttl = self._ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Remove an entry and return its value."""
+        entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class GenerationCounter:
+    """
+    Per-key counters for invalidating cached values derived from a key.
+
+    Values cached together with their key's current generation are stale
+    once the generation is bumped, so writers need not find every entry.
+    Keys are only added by bump(), i.e. once per key that was written.
+    """
+
+    def __init__(self) -> None:
+        self._generations: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> int:
+        """Return the key's current generation."""
+        return self._generations.get(key, 0)
+
+    def bump(self, key: Hashable) -> None:
+        """Mark every value cached for the key so far as stale."""
+        self._generations[key] = self._generations.get(key, 0) + 1
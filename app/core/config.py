@@ -3,7 +3,7 @@ Application configuration using Pydantic Settings.
 Environment-based configuration with validation.
 """
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,7 +20,9 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        # One instance is shared by the whole process; never mutate it
+        frozen=True
     )
 
     # ===================
@@ -47,12 +49,12 @@ class Settings(BaseSettings):
     # ===================
     BACKEND_URL: str = "http://127.0.0.1:8000"
     FRONTEND_URL: str = "http://127.0.0.1:5173"
-    ALLOWED_ORIGINS: List[str] = [
+    ALLOWED_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://127.0.0.1:3000",
         "http://localhost:5173",
         "http://127.0.0.1:5173"
-    ]
+    )
 
     # ===================
     # MongoDB Settings
@@ -70,6 +72,8 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 1 day
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     COOKIE_EXPIRES_DAYS: int = 7
+    AUTH_CACHE_TTL_SECONDS: int = 30
+    AUTH_CACHE_MAX_SIZE: int = 10000
 
     # ===================
     # SMTP Settings
@@ -88,6 +92,7 @@ class Settings(BaseSettings):
     STRIPE_PUBLISHABLE_KEY: str = ""
     STRIPE_SECRET_KEY: str = ""
     STRIPE_WEBHOOK_SECRET: str = ""
+    STRIPE_MAX_CONCURRENCY: int = 20
 
     # ===================
     # OAuth - Google
@@ -118,6 +123,15 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_ENABLED: bool = False
 
+    # ===================
+    # In-process Caching
+    # ===================
+    PRODUCT_LIST_CACHE_TTL_SECONDS: int = 10
+    PRODUCT_LIST_CACHE_MAX_SIZE: int = 512
+    PROFILE_CACHE_TTL_SECONDS: int = 30
+    PROFILE_CACHE_MAX_SIZE: int = 10000
+    USER_PAGE_CACHE_TTL_SECONDS: int = 15
+
     # ===================
     # File Storage Settings
     # ===================
@@ -154,7 +168,7 @@ class Settings(BaseSettings):
     def parse_cors_origins(cls, v):
         """Parse CORS origins from comma-separated string."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return tuple(origin.strip() for origin in v.split(","))
         return v
 
     @field_validator("ALLOWED_IMAGE_TYPES", mode="before")
@@ -181,7 +195,7 @@ class Settings(BaseSettings):
         return self.MONGODB_URL
 
     @property
-    def CORS_ORIGINS(self) -> list[str]:
+    def CORS_ORIGINS(self) -> Tuple[str, ...]:
         """Get CORS allowed origins."""
         return self.ALLOWED_ORIGINS
 
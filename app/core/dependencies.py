@@ -8,6 +8,7 @@ from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.codecs import TYPE_REGISTRY
 
 logger = get_logger(__name__)
 
@@ -15,16 +16,8 @@ logger = get_logger(__name__)
 _mongo_client: Optional[AsyncIOMotorClient] = None
 
 
-async def get_database() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
-    """
-    Get MongoDB database instance.
-
-    This is a FastAPI dependency that provides access to the database.
-    The connection is reused across requests for efficiency.
-
-    Yields:
-        AsyncIOMotorDatabase: MongoDB database instance
-    """
+def _get_client() -> AsyncIOMotorClient:
+    """Return the shared MongoDB client, creating it on first use."""
     global _mongo_client
 
     if _mongo_client is None:
@@ -36,10 +29,37 @@ async def get_database() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
         _mongo_client = AsyncIOMotorClient(
             settings.MONGODB_URL,
             minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
-            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            type_registry=TYPE_REGISTRY
         )
 
-    yield _mongo_client[settings.MONGODB_DB_NAME]
+    return _mongo_client
+
+
+def get_db() -> AsyncIOMotorDatabase:
+    """
+    Get the MongoDB database handle.
+
+    The handle is a lightweight singleton bound to the shared client,
+    so it is safe to hold onto for the lifetime of the application.
+
+    Returns:
+        AsyncIOMotorDatabase: MongoDB database instance
+    """
+    return _get_client()[settings.MONGODB_DB_NAME]
+
+
+async def get_database() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
+    """
+    Get MongoDB database instance.
+
+    This is a FastAPI dependency that provides access to the database.
+    The connection is reused across requests for efficiency.
+
+    Yields:
+        AsyncIOMotorDatabase: MongoDB database instance
+    """
+    yield get_db()
 
 
 async def init_database() -> None:
@@ -48,25 +68,28 @@ async def init_database() -> None:
 
     Called during application startup.
     """
-    global _mongo_client
-
-    if _mongo_client is None:
-        logger.info(
-            "Initializing MongoDB connection",
-            url=settings.MONGODB_URL,
-            db=settings.MONGODB_DB_NAME
-        )
-        _mongo_client = AsyncIOMotorClient(
-            settings.MONGODB_URL,
-            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
-            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE
-        )
-
-    db = _mongo_client[settings.MONGODB_DB_NAME]
+    db = get_db()
 
     # Create indexes for users collection
     await db.users.create_index("email", unique=True)
     await db.users.create_index("reset_password_token")
+    # Covers the admin list: sort keys first, then every projected field
+    await db.users.create_index(
+        [
+            ("created_at", -1),
+            ("_id", -1),
+            ("name", 1),
+            ("email", 1),
+            ("avatar", 1),
+            ("role", 1),
+        ],
+        name="admin_list_cover"
+    )
+    # OAuth logins; only OAuth users carry these fields
+    await db.users.create_index(
+        [("oauth_provider", 1), ("oauth_provider_id", 1)],
+        sparse=True
+    )
 
     # Create indexes for products collection
     await db.products.create_index("name")
@@ -74,11 +97,27 @@ async def init_database() -> None:
     await db.products.create_index("price")
     await db.products.create_index("ratings")
     await db.products.create_index([("name", "text"), ("description", "text")])
+    await db.products.create_index([("category", 1), ("price", 1)])
+    # Match the sort orders of the category, seller and top-rated queries
+    await db.products.create_index([("category", 1), ("created_at", -1)])
+    await db.products.create_index([("seller", 1), ("created_at", -1)])
+    await db.products.create_index(
+        [("ratings", -1), ("num_of_reviews", -1)],
+        partialFilterExpression={"ratings": {"$gt": 0}}
+    )
+
+    # Full review history: one review per user and product, newest first
+    await db.product_reviews.create_index([("product_id", 1), ("user", 1)], unique=True)
+    await db.product_reviews.create_index([("product_id", 1), ("created_at", -1)])
 
     # Create indexes for orders collection
     await db.orders.create_index("user")
     await db.orders.create_index("created_at")
     await db.orders.create_index("order_status")
+    await db.orders.create_index([("created_at", 1), ("order_status", 1)])
+    # Serve the user and status listings' filter and newest-first sort
+    await db.orders.create_index([("user", 1), ("created_at", -1)])
+    await db.orders.create_index([("order_status", 1), ("created_at", -1)])
 
     logger.info("Database indexes created successfully")
 
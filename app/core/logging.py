@@ -2,60 +2,311 @@
 Structured logging configuration using structlog.
 Provides JSON and text formatters for different environments.
 """
+from functools import lru_cache
+import atexit
 import logging
+import os
+import queue
+import socket
 import sys
-from typing import Any
+import threading
+import time
+from types import FunctionType
+from typing import Any, BinaryIO, Optional, Union
 
+import orjson
 import structlog
-from structlog.types import Processor
+from structlog.types import EventDict, Processor
 
 from app.core.config import settings
 
+# Minimum enabled level, resolved once from settings
+_MIN_LEVEL = getattr(logging, settings.LOG_LEVEL.upper())
+
+# Process identity attached to every event, resolved once at import; the
+# pid is refreshed in forked children (e.g. gunicorn --preload workers)
+_HOST = socket.gethostname()
+_PID = os.getpid()
+_SERVICE = settings.APP_NAME
+
+
+def _refresh_pid() -> None:
+    """Pick up the child's pid after a fork."""
+    global _PID
+    _PID = os.getpid()
+
+
+os.register_at_fork(after_in_child=_refresh_pid)
+
+
+# Lines held for the writer thread before new ones are dropped
+_QUEUE_MAX_LINES = 10_000
+
+
+def _report(message: str) -> None:
+    """Report a problem with log output itself on stderr."""
+    try:
+        sys.stderr.write(f"log-writer: {message}\n")
+        sys.stderr.flush()
+    except Exception:
+        pass
+
+
+class _QueuedStream:
+    """
+    File-like object that hands writes to a background thread.
+
+    Callers only enqueue the line; a single thread performs the blocking
+    writes to the underlying binary stream and flushes whenever the queue
+    runs empty, so slow stdout consumers never stall the event loop.
+    Both str and bytes lines are accepted.
+
+    The queue is bounded: while the stream cannot keep up, new lines are
+    dropped instead of growing memory, and the number dropped is reported
+    on stderr once the queue drains. Write errors are reported the same
+    way without stopping the thread. After close(), lines are written
+    directly.
+    """
+
+    def __init__(self, stream: BinaryIO, maxsize: int = _QUEUE_MAX_LINES):
+        self._stream = stream
+        self._maxsize = maxsize
+        self._closed = False
+        self._start()
+
+    def _start(self) -> None:
+        """Start the writer thread on a fresh queue."""
+        self._queue: queue.Queue = queue.Queue(self._maxsize)
+        # Approximate under contention; only used for reporting
+        self._dropped = 0
+        self._thread = threading.Thread(
+            target=self._drain,
+            name="log-writer",
+            daemon=True
+        )
+        self._thread.start()
+
+    def after_fork(self) -> None:
+        """Restart the writer thread, which a forked child does not inherit."""
+        if not self._closed:
+            self._start()
+
+    def write(self, data: Union[str, bytes]) -> None:
+        """Queue data for writing."""
+        if self._closed:
+            self._write(data)
+            self._flush()
+            return
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            self._dropped += 1
+
+    def flush(self) -> None:
+        """No-op; the writer thread flushes once the queue is drained."""
+
+    def close(self) -> None:
+        """Write everything already queued, then stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write(self, data: Union[str, bytes]) -> None:
+        """Write one line, reporting rather than raising on failure."""
+        if isinstance(data, str):
+            data = data.encode("utf-8", "backslashreplace")
+        try:
+            self._stream.write(data)
+        except Exception as e:
+            _report(f"write failed: {e!r}")
+
+    def _flush(self) -> None:
+        """Flush the stream, reporting rather than raising on failure."""
+        try:
+            self._stream.flush()
+        except Exception as e:
+            _report(f"flush failed: {e!r}")
+
+    def _drain(self) -> None:
+        """Writer thread loop."""
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            self._write(data)
+            if self._queue.empty():
+                self._flush()
+                if self._dropped:
+                    dropped, self._dropped = self._dropped, 0
+                    _report(f"dropped {dropped} log lines while output was blocked")
+        self._flush()
+
+
+# Shared by structlog and the standard library handler, so lines from both
+# keep their relative order; created on the first setup_logging call
+_log_stream: Optional[_QueuedStream] = None
+
+
+def _restart_log_stream() -> None:
+    """Give a forked child its own log writer thread."""
+    if _log_stream is not None:
+        _log_stream.after_fork()
+
+
+os.register_at_fork(after_in_child=_restart_log_stream)
+
+
+class _NamedBytesLogger(structlog.BytesLogger):
+    """BytesLogger that keeps the name it was requested under."""
+
+    __slots__ = ("name",)
+
+
+class _NamedWriteLogger(structlog.WriteLogger):
+    """WriteLogger that keeps the name it was requested under."""
+
+    name: str
+
+
+class _NamedLoggerFactory:
+    """Logger factory producing loggers of one class on a shared stream."""
+
+    def __init__(self, logger_class: type, stream: _QueuedStream):
+        self._logger_class = logger_class
+        self._stream = stream
+
+    def __call__(self, name: str = "", *args: Any) -> Any:
+        logger = self._logger_class(self._stream)
+        logger.name = name
+        return logger
+
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+# (whole UTC second, its formatted date and time), replaced as one tuple so
+# concurrent writers never see a mismatched pair
+_timestamp_second: tuple[int, str] = (0, "")
+
+
+def _add_timestamp(
+    logger: Any,
+    method_name: str,
+    event_dict: EventDict
+) -> EventDict:
+    """
+    Add an ISO 8601 UTC timestamp with microseconds.
+
+    The date and time part is formatted once per second and shared by
+    every event in that second; only the fraction is formatted per event.
+    """
+    global _timestamp_second
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_second = (second, prefix)
+
+    event_dict["timestamp"] = f"{prefix}.{int((now - second) * 1_000_000):06d}Z"
+    return event_dict
+
+
+def _render_stack_and_exc_info(
+    logger: Any,
+    method_name: str,
+    event_dict: EventDict
+) -> EventDict:
+    """
+    Render stack_info and exc_info only for events that carry them.
+
+    Most events have neither, so this replaces two processor calls per
+    event with two key lookups.
+    """
+    if "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _add_process_identity(
+    logger: Any,
+    method_name: str,
+    event_dict: EventDict
+) -> EventDict:
+    """Add host, pid and service name unless the event sets them."""
+    event_dict.setdefault("host", _HOST)
+    event_dict.setdefault("pid", _PID)
+    event_dict.setdefault("service", _SERVICE)
+    return event_dict
+
 
 def setup_logging() -> None:
     """
     Configure application logging with structlog.
 
     Sets up JSON logging for production and readable text for development.
+    Application loggers write straight to stdout without passing through
+    the logging module; JSON lines are serialized by orjson to bytes.
+    Standard library logging is configured only for third-party loggers.
+    All output goes through one queued stream whose background thread
+    does the actual writes.
     """
-    # Shared processors for both handlers
+    global _log_stream
+
+    if _log_stream is None:
+        _log_stream = _QueuedStream(sys.stdout.buffer)
+        atexit.register(_log_stream.close)
+
+    # Shared processors for both handlers. add_logger_name only reads
+    # logger.name, which both logger factories below provide.
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        structlog.processors.add_log_level,
+        _add_process_identity,
+        _add_timestamp,
+        _render_stack_and_exc_info,
         structlog.processors.UnicodeDecoder(),
     ]
 
     if settings.LOG_FORMAT == "json":
         # JSON format for production
         processors = shared_processors + [
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        ]
+        logger_factory = _NamedLoggerFactory(_NamedBytesLogger, _log_stream)
+    elif sys.stdout.isatty():
+        # Human-readable format for development; key sorting and event
+        # padding are skipped, since both cost work on every event
+        processors = shared_processors + [
+            structlog.dev.ConsoleRenderer(colors=True, sort_keys=False, pad_event=0)
         ]
+        logger_factory = _NamedLoggerFactory(_NamedWriteLogger, _log_stream)
     else:
-        # Human-readable format for development
+        # Text output piped somewhere other than a terminal gets plain
+        # key=value lines; colors and alignment would be wasted there
         processors = shared_processors + [
-            structlog.dev.ConsoleRenderer(colors=True)
+            structlog.processors.KeyValueRenderer(sort_keys=False)
         ]
+        logger_factory = _NamedLoggerFactory(_NamedWriteLogger, _log_stream)
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, settings.LOG_LEVEL.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(_MIN_LEVEL),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
+    # Configure standard library logging for third-party libraries
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
+        stream=_log_stream,
+        level=_MIN_LEVEL,
     )
 
     # Reduce noise from third-party libraries
@@ -65,10 +316,15 @@ def setup_logging() -> None:
     logging.getLogger("aiokafka").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.BoundLogger:
     """
     Get a logger instance with the given name.
 
+    Loggers write directly to stdout; events do not go through the
+    logging module's records, handlers or formatters. One logger is kept
+    per name, so repeated calls return the same instance.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -83,47 +339,105 @@ class LoggerAdapter:
     Logger adapter that adds context to all log messages.
 
     Useful for adding request-specific context like user_id, request_id.
+    Calls below the configured level return before any context is merged.
+    The logger's methods are looked up once, when the adapter is created,
+    so adapters should be created after setup_logging has run.
     """
 
+    __slots__ = (
+        "_logger",
+        "_extra",
+        "_min_level",
+        "_debug",
+        "_info",
+        "_warning",
+        "_error",
+        "_exception",
+    )
+
     def __init__(self, logger: structlog.BoundLogger, extra: dict[str, Any]):
         self._logger = logger
         self._extra = extra
+        self._min_level = _MIN_LEVEL
+        self._debug = logger.debug
+        self._info = logger.info
+        self._warning = logger.warning
+        self._error = logger.error
+        self._exception = logger.exception
 
-    def _log(self, method: str, msg: str, **kwargs: Any) -> None:
+    def _log(self, log_method: Any, msg: str, kwargs: dict[str, Any]) -> None:
         """Internal method to add extra context to logs."""
-        kwargs.update(self._extra)
-        getattr(self._logger, method)(msg, **kwargs)
+        if self._extra:
+            kwargs.update(self._extra)
+        # Functions and lambdas are deferred values, evaluated only now that
+        # the event is known to be emitted; classes and other callables are
+        # logged as they are
+        for key, value in kwargs.items():
+            if isinstance(value, FunctionType):
+                kwargs[key] = value()
+        log_method(msg, **kwargs)
 
     def debug(self, msg: str, **kwargs: Any) -> None:
         """Log debug message."""
-        self._log("debug", msg, **kwargs)
+        if logging.DEBUG >= self._min_level:
+            self._log(self._debug, msg, kwargs)
 
     def info(self, msg: str, **kwargs: Any) -> None:
         """Log info message."""
-        self._log("info", msg, **kwargs)
+        if logging.INFO >= self._min_level:
+            self._log(self._info, msg, kwargs)
 
     def warning(self, msg: str, **kwargs: Any) -> None:
         """Log warning message."""
-        self._log("warning", msg, **kwargs)
+        if logging.WARNING >= self._min_level:
+            self._log(self._warning, msg, kwargs)
 
     def error(self, msg: str, **kwargs: Any) -> None:
         """Log error message."""
-        self._log("error", msg, **kwargs)
+        if logging.ERROR >= self._min_level:
+            self._log(self._error, msg, kwargs)
 
     def exception(self, msg: str, **kwargs: Any) -> None:
         """Log exception with stack trace."""
-        self._log("exception", msg, **kwargs)
+        if logging.ERROR >= self._min_level:
+            self._log(self._exception, msg, kwargs)
 
     def bind(self, **kwargs: Any) -> "LoggerAdapter":
-        """Create new adapter with additional context."""
-        extra = {**self._extra, **kwargs}
-        return LoggerAdapter(self._logger, extra)
+        """
+        Create new adapter with additional context.
 
+        Plain values are bound on the underlying structlog logger, so
+        they are merged once here rather than on every call; only
+        deferred values (functions and lambdas) stay in the adapter's own
+        context.
+        """
+        if not kwargs:
+            return self
+        static = {}
+        deferred = {}
+        for key, value in kwargs.items():
+            if isinstance(value, FunctionType):
+                deferred[key] = value
+            else:
+                static[key] = value
+        logger = self._logger.bind(**static) if static else self._logger
+        extra = {**self._extra, **deferred} if deferred else self._extra
+        return LoggerAdapter(logger, extra)
 
-def create_logger_with_context(name: str, **context: Any) -> LoggerAdapter:
+
+def create_logger_with_context(
+    name: str,
+    **context: Any
+) -> LoggerAdapter:
     """
     Create a logger with pre-bound context.
 
+    Context and per-call values may be zero-argument functions or lambdas;
+    they are only called for messages at or above the configured level,
+    e.g. logger.debug("Order loaded", summary=lambda: order.to_summary_dict()).
+    Other callables, such as classes or bound methods, are logged as
+    values and never called.
+
     Args:
         name: Logger name
         **context: Key-value pairs to include in all log messages
@@ -131,5 +445,4 @@ def create_logger_with_context(name: str, **context: Any) -> LoggerAdapter:
     Returns:
         LoggerAdapter with bound context
     """
-    base_logger = get_logger(name)
-    return LoggerAdapter(base_logger, context)
+    return LoggerAdapter(get_logger(name), {}).bind(**context)
@@ -2,24 +2,40 @@
 Security utilities for authentication and authorization.
 Handles JWT tokens, password hashing, and OAuth.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 import hashlib
+import hmac
 import secrets
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
+from jose import JWTError, jwk, jwt
 
 from app.core.config import settings
 
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Argon2 hasher used directly, rather than through a passlib CryptContext;
+# parameters are taken from each stored hash when verifying
+_password_hasher = PasswordHasher()
+
+# Prefixes of bcrypt hashes carried over from the previous backend
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# JWT key object built once; passing the raw secret would make jose
+# reconstruct the key on every encode and decode
+_JWT_KEY = jwk.construct(settings.JWT_SECRET, settings.JWT_ALGORITHM)
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# Default token lifetimes
+_ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_LIFETIME = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a plain text password using bcrypt.
+    Hash a plain text password using argon2id.
 
     Args:
         password: Plain text password to hash
@@ -27,13 +43,16 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
 
+    Argon2 hashes are checked with argon2-cffi; legacy bcrypt hashes are
+    still accepted.
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password to compare against
@@ -41,7 +60,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        except ValueError:
+            return False
+
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def create_access_token(
@@ -58,24 +86,18 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+    # One clock read, so exp and iat are consistent
+    now = datetime.now(timezone.utc)
+    to_encode = {
+        **data,
+        "exp": now + (expires_delta or _ACCESS_TOKEN_LIFETIME),
+        "iat": now,
         "type": "access"
-    })
+    }
 
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET,
+        _JWT_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
 
@@ -94,24 +116,18 @@ def create_refresh_token(
     Returns:
         Encoded JWT refresh token string
     """
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+    # One clock read, so exp and iat are consistent
+    now = datetime.now(timezone.utc)
+    to_encode = {
+        **data,
+        "exp": now + (expires_delta or _REFRESH_TOKEN_LIFETIME),
+        "iat": now,
         "type": "refresh"
-    })
+    }
 
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET,
+        _JWT_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
 
@@ -132,14 +148,27 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS
         )
         return payload
     except JWTError:
         return None
 
 
+def hash_password_reset_token(raw_token: str) -> str:
+    """
+    Hash a password reset token for storage and lookup.
+
+    Args:
+        raw_token: Token sent to the user
+
+    Returns:
+        Hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+
 def generate_password_reset_token() -> tuple[str, str]:
     """
     Generate a password reset token.
@@ -150,14 +179,15 @@ def generate_password_reset_token() -> tuple[str, str]:
         - hashed_token: Store in database
     """
     raw_token = secrets.token_hex(32)
-    hashed_token = hashlib.sha256(raw_token.encode()).hexdigest()
-    return raw_token, hashed_token
+    return raw_token, hash_password_reset_token(raw_token)
 
 
 def verify_password_reset_token(raw_token: str, stored_hash: str) -> bool:
     """
     Verify a password reset token.
 
+    Compares raw 32-byte digests rather than their hex strings.
+
     Args:
         raw_token: Token received from user
         stored_hash: Hashed token stored in database
@@ -165,8 +195,12 @@ def verify_password_reset_token(raw_token: str, stored_hash: str) -> bool:
     Returns:
         True if token is valid, False otherwise
     """
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-    return secrets.compare_digest(token_hash, stored_hash)
+    try:
+        stored_digest = bytes.fromhex(stored_hash)
+    except ValueError:
+        return False
+    token_digest = hashlib.sha256(raw_token.encode()).digest()
+    return hmac.compare_digest(token_digest, stored_digest)
 
 
 def generate_oauth_state() -> str:
@@ -3,9 +3,9 @@ Cart domain entities.
 Cart is primarily managed client-side but we define entities
 for API validation and order creation.
 """
-from typing import List
-from decimal import Decimal
-from pydantic import Field, field_validator
+from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal, ROUND_HALF_UP
+from pydantic import ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 from app.domain.shared.entity import BaseEntity
 
@@ -16,12 +16,18 @@ class CartItem(BaseEntity):
 
     Used for validating cart data when creating orders.
     """
+    # Re-validate on assignment, so price changes refresh the cached cents
+    # and quantity updates keep their bounds
+    model_config = ConfigDict(validate_assignment=True)
+
     product: str = Field(..., description="Product ID")
     name: str = Field(..., description="Product name")
     price: Decimal = Field(..., ge=0, description="Unit price")
     quantity: int = Field(..., ge=1, description="Quantity")
     image: str = Field(..., description="Product image URL")
     stock: int = Field(..., ge=0, description="Available stock")
+    # Unit price in integer cents, kept in step with price by the validator
+    _price_cents: int = PrivateAttr(default=0)
 
     @field_validator("price", mode="before")
     @classmethod
@@ -31,10 +37,21 @@ class CartItem(BaseEntity):
             return Decimal(str(v))
         return v
 
+    @model_validator(mode="after")
+    def cache_price_cents(self) -> "CartItem":
+        """Store the unit price as integer cents for totals arithmetic."""
+        self._price_cents = int((self.price * 100).to_integral_value(ROUND_HALF_UP))
+        return self
+
+    @property
+    def price_cents(self) -> int:
+        """Unit price in cents."""
+        return self._price_cents
+
     @property
     def subtotal(self) -> Decimal:
         """Calculate item subtotal."""
-        return self.price * self.quantity
+        return Decimal(self._price_cents * self.quantity).scaleb(-2)
 
     def can_add_more(self, additional: int = 1) -> bool:
         """Check if more items can be added."""
@@ -46,46 +63,106 @@ class Cart(BaseEntity):
     Shopping cart.
 
     Primarily used for validation when processing checkout.
+    Items are indexed by product ID, so lookups by product do not scan
+    the list; mutate items through the methods below to keep both in sync.
     """
     items: List[CartItem] = Field(default_factory=list)
+    _by_product: Dict[str, CartItem] = PrivateAttr(default_factory=dict)
+    # (items count, subtotal), cleared by every mutating method
+    _totals: Optional[Tuple[int, Decimal]] = PrivateAttr(default=None)
+    _frozen: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index the initial items by product ID."""
+        for item in self.items:
+            self._by_product.setdefault(item.product, item)
+
+    def _ensure_mutable(self) -> None:
+        """Raise if this cart is a frozen snapshot."""
+        if self._frozen:
+            raise TypeError("Frozen cart cannot be modified")
+
+    def freeze(self) -> "Cart":
+        """
+        Return a read-only snapshot of this cart, e.g. for checkout.
+
+        The snapshot holds copies of the items in a tuple, so later
+        changes to this cart do not affect it; its mutating methods
+        raise TypeError.
+        """
+        frozen = Cart.model_construct(
+            id=self.id,
+            created_at=self.created_at,
+            items=tuple(item.model_copy() for item in self.items)
+        )
+        frozen._frozen = True
+        return frozen
+
+    def totals(self) -> Tuple[int, Decimal]:
+        """
+        Item count and subtotal, computed together in one pass.
+
+        Returns:
+            Tuple of (total quantity, subtotal)
+        """
+        if self._totals is None:
+            count = 0
+            subtotal_cents = 0
+            for item in self.items:
+                count += item.quantity
+                subtotal_cents += item.price_cents * item.quantity
+            self._totals = (count, Decimal(subtotal_cents).scaleb(-2))
+        return self._totals
 
     @property
     def items_count(self) -> int:
         """Total number of items in cart."""
-        return sum(item.quantity for item in self.items)
+        return self.totals()[0]
 
     @property
     def subtotal(self) -> Decimal:
         """Calculate cart subtotal."""
-        return sum(item.subtotal for item in self.items)
+        return self.totals()[1]
 
     def add_item(self, item: CartItem) -> None:
         """Add item to cart or update quantity if exists."""
-        for existing in self.items:
-            if existing.product == item.product:
-                existing.quantity += item.quantity
-                return
+        self._ensure_mutable()
+        self._totals = None
+        existing = self._by_product.get(item.product)
+        if existing is not None:
+            existing.quantity += item.quantity
+            return
+        self._by_product[item.product] = item
         self.items.append(item)
 
     def remove_item(self, product_id: str) -> bool:
         """Remove item from cart."""
-        initial_count = len(self.items)
+        self._ensure_mutable()
+        item = self._by_product.pop(product_id, None)
+        if item is None:
+            return False
+        self._totals = None
         self.items = [i for i in self.items if i.product != product_id]
-        return len(self.items) < initial_count
+        return True
 
     def update_quantity(self, product_id: str, quantity: int) -> bool:
         """Update item quantity."""
-        for item in self.items:
-            if item.product == product_id:
-                if quantity <= 0:
-                    return self.remove_item(product_id)
-                item.quantity = quantity
-                return True
-        return False
+        self._ensure_mutable()
+        item = self._by_product.get(product_id)
+        if item is None:
+            return False
+        if quantity <= 0:
+            return self.remove_item(product_id)
+        item.quantity = quantity
+        self._totals = None
+        return True
 
     def clear(self) -> None:
         """Clear all items from cart."""
+        self._ensure_mutable()
         self.items = []
+        self._by_product.clear()
+        self._totals = None
 
     def is_empty(self) -> bool:
         """Check if cart is empty."""
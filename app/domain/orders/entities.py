@@ -1,12 +1,12 @@
 """
 Order domain entities.
 """
-from typing import Optional, List
+from typing import Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 from pydantic import Field, field_validator, model_validator
 
-from app.domain.shared.entity import BaseEntity
+from app.domain.shared.entity import BaseEntity, utcnow
 from app.domain.orders.value_objects import OrderStatus
 
 
@@ -54,8 +54,8 @@ class OrderItem(BaseEntity):
         return v
 
     @property
-    def subtotal(self) -> Decimal:
-        """Calculate subtotal for this item."""
+    def subtotal(self) -> int:
+        """Calculate subtotal for this item (integer arithmetic)."""
         return self.price * self.quantity
 
 
@@ -74,7 +74,8 @@ class Order(BaseEntity):
 
     user: str = Field(..., description="User ID who placed the order")
     shipping_info: ShippingInfo = Field(..., description="Shipping details")
-    order_items: List[OrderItem] = Field(
+    # Order lines never change after creation, so they are kept in a tuple
+    order_items: Tuple[OrderItem, ...] = Field(
         ...,
         min_length=1,
         description="Items in the order"
@@ -127,11 +128,12 @@ class Order(BaseEntity):
     @model_validator(mode="after")
     def calculate_totals(self) -> "Order":
         """Calculate and validate order totals."""
-        # Calculate items price from order items
+        # Calculate items price from order items; item prices are ints,
+        # so the sum stays integer and becomes a Decimal once
         if self.order_items:
-            self.items_price = sum(
-                item.subtotal for item in self.order_items
-            )
+            self.items_price = Decimal(sum(
+                item.price * item.quantity for item in self.order_items
+            ))
 
         # Calculate total
         self.total_price = (
@@ -142,6 +144,51 @@ class Order(BaseEntity):
 
         return self
 
+    @classmethod
+    def from_mongo(cls, document: dict) -> "Order":
+        """
+        Build an order from a stored document without re-validating it.
+
+        Totals were calculated when the order was written, so they are
+        taken as stored; amounts are converted to Decimal, the status to
+        its enum and the embedded documents to entities.
+        """
+        shipping = document["shipping_info"]
+        payment = document.get("payment_info")
+        return cls.model_construct(
+            id=document.get("_id"),
+            created_at=document.get("created_at") or utcnow(),
+            user=document["user"],
+            shipping_info=ShippingInfo.model_construct(
+                address=shipping["address"],
+                city=shipping["city"],
+                country=shipping["country"],
+                postal_code=shipping["postal_code"],
+                phone_no=shipping["phone_no"]
+            ),
+            order_items=tuple(
+                OrderItem.model_construct(
+                    product=item["product"],
+                    name=item["name"],
+                    price=int(item["price"]),
+                    quantity=item["quantity"],
+                    image=item["image"]
+                )
+                for item in document["order_items"]
+            ),
+            items_price=Decimal(str(document.get("items_price", 0))),
+            tax_price=Decimal(str(document.get("tax_price", 0))),
+            shipping_price=Decimal(str(document.get("shipping_price", 0))),
+            total_price=Decimal(str(document.get("total_price", 0))),
+            payment_info=(
+                PaymentInfo.model_construct(id=payment["id"], status=payment["status"])
+                if payment else None
+            ),
+            paid_at=document.get("paid_at"),
+            delivered_at=document.get("delivered_at"),
+            order_status=OrderStatus(document.get("order_status") or OrderStatus.PROCESSING.value)
+        )
+
     def is_paid(self) -> bool:
         """Check if order has been paid."""
         return (
@@ -26,25 +26,40 @@ class OrderStatus(str, Enum):
 
         Defines the valid state machine for order status changes.
         """
-        valid_transitions = {
-            cls.PROCESSING: [cls.CONFIRMED, cls.CANCELLED],
-            cls.CONFIRMED: [cls.SHIPPED, cls.CANCELLED],
-            cls.SHIPPED: [cls.OUT_FOR_DELIVERY, cls.CANCELLED],
-            cls.OUT_FOR_DELIVERY: [cls.DELIVERED],
-            cls.DELIVERED: [cls.REFUNDED],
-            cls.CANCELLED: [],
-            cls.REFUNDED: [],
-        }
-
-        return new in valid_transitions.get(current, [])
+        return (current, new) in _VALID_TRANSITIONS
 
     def is_final(self) -> bool:
         """Check if this is a final status (no more transitions allowed)."""
-        return self in [self.DELIVERED, self.CANCELLED, self.REFUNDED]
+        return self in _FINAL_STATUSES
 
     def is_cancellable(self) -> bool:
         """Check if order with this status can be cancelled."""
-        return self in [self.PROCESSING, self.CONFIRMED, self.SHIPPED]
+        return self in _CANCELLABLE_STATUSES
+
+
+# Order status state machine as (current, new) pairs
+_VALID_TRANSITIONS = frozenset({
+    (OrderStatus.PROCESSING, OrderStatus.CONFIRMED),
+    (OrderStatus.PROCESSING, OrderStatus.CANCELLED),
+    (OrderStatus.CONFIRMED, OrderStatus.SHIPPED),
+    (OrderStatus.CONFIRMED, OrderStatus.CANCELLED),
+    (OrderStatus.SHIPPED, OrderStatus.OUT_FOR_DELIVERY),
+    (OrderStatus.SHIPPED, OrderStatus.CANCELLED),
+    (OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED),
+    (OrderStatus.DELIVERED, OrderStatus.REFUNDED),
+})
+
+_FINAL_STATUSES = frozenset({
+    OrderStatus.DELIVERED,
+    OrderStatus.CANCELLED,
+    OrderStatus.REFUNDED,
+})
+
+_CANCELLABLE_STATUSES = frozenset({
+    OrderStatus.PROCESSING,
+    OrderStatus.CONFIRMED,
+    OrderStatus.SHIPPED,
+})
 
 
 class PaymentStatus(str, Enum):
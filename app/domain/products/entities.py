@@ -3,19 +3,26 @@ Product domain entities.
 Represents products in the e-commerce system.
 """
 from typing import Optional, List
-from decimal import Decimal
-from pydantic import Field, field_validator
+from decimal import Decimal, ROUND_HALF_UP
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
-from app.domain.shared.entity import BaseEntity
+from app.domain.shared.entity import BaseEntity, utcnow
 from app.domain.products.value_objects import ProductCategory
 
+# Most recent reviews kept embedded on a product for display; the full
+# history is stored in the product_reviews collection
+RECENT_REVIEW_CAP = 20
+
 
 class ProductImage(BaseEntity):
     """
     Represents a product image.
 
-    Stored as embedded document within Product.
+    Stored as embedded document within Product. Immutable; a changed
+    image list replaces the old images.
     """
+    model_config = ConfigDict(frozen=True)
+
     image: str = Field(..., description="Image URL or path")
 
 
@@ -23,8 +30,11 @@ class ProductReview(BaseEntity):
     """
     Represents a customer review for a product.
 
-    Stored as embedded document within Product.
+    Stored as embedded document within Product. Immutable; a changed
+    review replaces the old one.
     """
+    model_config = ConfigDict(frozen=True)
+
     user: str = Field(..., description="User ID who wrote the review")
     rating: float = Field(..., ge=0, le=5, description="Rating from 0-5")
     comment: str = Field(..., min_length=1, description="Review comment")
@@ -58,10 +68,10 @@ class Product(BaseEntity):
         max_length=100,
         description="Product name"
     )
-    price: Decimal = Field(
-        default=Decimal("0.00"),
+    price_cents: int = Field(
+        default=0,
         ge=0,
-        description="Product price"
+        description="Product price in cents"
     )
     description: str = Field(
         ...,
@@ -78,6 +88,10 @@ class Product(BaseEntity):
         default_factory=list,
         description="Product images"
     )
+    primary_image: Optional[str] = Field(
+        default=None,
+        description="URL of the first image, stored for listing views"
+    )
     category: ProductCategory = Field(
         ...,
         description="Product category"
@@ -105,6 +119,11 @@ class Product(BaseEntity):
         default=None,
         description="ID of user who created the product"
     )
+    rating_sum: Optional[float] = Field(
+        default=None,
+        description="Sum of all review ratings; None on products stored "
+                    "before it was kept, whose reviews are all embedded"
+    )
 
     @field_validator("ratings", mode="before")
     @classmethod
@@ -114,13 +133,76 @@ class Product(BaseEntity):
             return float(v) if v else 0.0
         return v
 
-    @field_validator("price", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def convert_price(cls, v):
-        """Convert price to Decimal."""
-        if isinstance(v, (int, float, str)):
-            return Decimal(str(v))
-        return v
+    def convert_price(cls, data):
+        """Accept a price in currency units and store it as cents."""
+        if isinstance(data, dict) and "price" in data:
+            data = dict(data)
+            price = Decimal(str(data.pop("price")))
+            data["price_cents"] = int((price * 100).to_integral_value(ROUND_HALF_UP))
+        return data
+
+    @property
+    def price(self) -> Decimal:
+        """Product price in currency units."""
+        return Decimal(self.price_cents).scaleb(-2)
+
+    @price.setter
+    def price(self, value: Decimal) -> None:
+        self.price_cents = int((Decimal(value) * 100).to_integral_value(ROUND_HALF_UP))
+
+    @model_validator(mode="after")
+    def set_primary_image(self) -> "Product":
+        """Derive primary_image from the images list."""
+        self.primary_image = self.images[0].image if self.images else None
+        return self
+
+    @classmethod
+    def from_mongo(cls, document: dict) -> "Product":
+        """
+        Build a product from a stored document without re-validating it.
+
+        Only the conversions validation would apply are done here: price
+        to cents, category to its enum, and nested images and reviews
+        to entities. Fields missing from projected documents get their
+        defaults; unknown keys (e.g. a text search score) are dropped.
+        Documents stored before primary_image existed take it from images.
+        """
+        images = [
+            ProductImage.model_construct(
+                id=image.get("_id"),
+                created_at=image.get("created_at") or utcnow(),
+                image=image["image"]
+            )
+            for image in document.get("images", ())
+        ]
+        return cls.model_construct(
+            id=document.get("_id"),
+            created_at=document.get("created_at") or utcnow(),
+            name=document["name"],
+            price_cents=round(document.get("price", 0) * 100),
+            description=document.get("description", ""),
+            ratings=float(document.get("ratings") or 0.0),
+            images=images,
+            primary_image=document.get("primary_image") or (images[0].image if images else None),
+            category=ProductCategory(document["category"]),
+            seller=document["seller"],
+            stock=document["stock"],
+            num_of_reviews=document.get("num_of_reviews", 0),
+            rating_sum=document.get("rating_sum"),
+            reviews=[
+                ProductReview.model_construct(
+                    id=review.get("_id"),
+                    created_at=review.get("created_at") or utcnow(),
+                    user=review["user"],
+                    rating=float(review["rating"]),
+                    comment=review["comment"]
+                )
+                for review in document.get("reviews", ())
+            ],
+            user=document.get("user")
+        )
 
     def is_in_stock(self) -> bool:
         """Check if product is in stock."""
@@ -152,16 +234,31 @@ class Product(BaseEntity):
             raise ValueError("Cannot add negative stock")
         self.stock += quantity
 
+    def set_images(self, images: List[ProductImage]) -> None:
+        """
+        Replace the product images, keeping primary_image in step.
+
+        Args:
+            images: New images, first one is the primary image
+        """
+        self.images = images
+        self.primary_image = images[0].image if images else None
+
     def add_review(self, review: ProductReview) -> None:
         """
         Add a review and recalculate average rating.
 
+        Only the newest RECENT_REVIEW_CAP reviews stay embedded; the
+        count and average cover every review.
+
         Args:
             review: New review to add
         """
+        rating_sum = self._current_rating_sum()
         self.reviews.append(review)
-        self.num_of_reviews = len(self.reviews)
-        self._calculate_average_rating()
+        if len(self.reviews) > RECENT_REVIEW_CAP:
+            del self.reviews[:-RECENT_REVIEW_CAP]
+        self._set_rating_totals(rating_sum + review.rating, self.num_of_reviews + 1)
 
     def remove_review(self, user_id: str) -> bool:
         """
@@ -173,24 +270,33 @@ class Product(BaseEntity):
         Returns:
             True if review was removed
         """
-        initial_count = len(self.reviews)
-        self.reviews = [r for r in self.reviews if r.user != user_id]
-
-        if len(self.reviews) < initial_count:
-            self.num_of_reviews = len(self.reviews)
-            self._calculate_average_rating()
-            return True
-
-        return False
-
-    def _calculate_average_rating(self) -> None:
-        """Recalculate average rating from all reviews."""
-        if not self.reviews:
+        # Each user has at most one review; find it before touching the list
+        index = next(
+            (i for i, review in enumerate(self.reviews) if review.user == user_id),
+            -1
+        )
+        if index == -1:
+            return False
+
+        rating_sum = self._current_rating_sum() - self.reviews[index].rating
+        del self.reviews[index]
+        self._set_rating_totals(rating_sum, self.num_of_reviews - 1)
+        return True
+
+    def _current_rating_sum(self) -> float:
+        """Sum of all review ratings, filling in rating_sum if missing."""
+        if self.rating_sum is None:
+            self.rating_sum = sum(review.rating for review in self.reviews)
+        return self.rating_sum
+
+    def _set_rating_totals(self, rating_sum: float, num_of_reviews: int) -> None:
+        """Update review count, rating sum and average rating."""
+        self.rating_sum = rating_sum
+        self.num_of_reviews = num_of_reviews
+        if not num_of_reviews:
             self.ratings = 0.0
             return
-
-        total = sum(review.rating for review in self.reviews)
-        self.ratings = round(total / len(self.reviews), 1)
+        self.ratings = round(rating_sum / num_of_reviews, 1)
 
     def to_summary_dict(self) -> dict:
         """
@@ -202,10 +308,12 @@ class Product(BaseEntity):
         return {
             "id": self.id,
             "name": self.name,
-            "price": float(self.price),
+            "price": self.price_cents / 100,
             "ratings": self.ratings,
             "num_of_reviews": self.num_of_reviews,
             "stock": self.stock,
-            "category": self.category.value,
-            "image": self.images[0].image if self.images else None,
+            # ProductCategory is a str enum, so the member itself serializes
+            # as its value
+            "category": self.category,
+            "image": self.primary_image,
         }
@@ -28,4 +28,13 @@ class ProductCategory(str, Enum):
     @classmethod
     def values(cls) -> list[str]:
         """Return all category values as strings."""
-        return [category.value for category in cls]
+        return list(_CATEGORY_VALUES)
+
+    @classmethod
+    def values_set(cls) -> frozenset[str]:
+        """Return all category values as a set, for membership checks."""
+        return _CATEGORY_VALUE_SET
+
+
+_CATEGORY_VALUES = tuple(category.value for category in ProductCategory)
+_CATEGORY_VALUE_SET = frozenset(_CATEGORY_VALUES)
@@ -3,9 +3,15 @@ Base entity class for all domain entities.
 Provides common functionality and ID handling.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TypeVar
 from pydantic import BaseModel, Field, ConfigDict
 
+EntityT = TypeVar("EntityT", bound="BaseEntity")
+
+# Naive UTC "now", matching the datetimes MongoDB hands back; bound once so
+# entity defaults and checks skip the attribute lookup on datetime
+utcnow = datetime.utcnow
+
 
 class BaseEntity(BaseModel):
     """
@@ -17,24 +23,49 @@ class BaseEntity(BaseModel):
     - Pydantic model configuration
     """
 
+    # Assignments are not re-validated: entity methods and services assign
+    # already-typed values, and validating each one runs the field
+    # validators again. Entities that need it opt back in. Strings are not
+    # stripped here; request schemas strip user input once on the way in.
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True,
-        validate_assignment=True
+        validate_assignment=False
     )
 
     id: Optional[str] = Field(default=None, alias="_id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+
+    @classmethod
+    def from_mongo(cls: type[EntityT], document: dict) -> EntityT:
+        """
+        Build an entity from a stored MongoDB document.
+
+        Validates the document by default. Entities read on hot paths
+        override this to build themselves with model_construct, since
+        stored documents were validated when they were written.
+
+        Args:
+            document: Document with ObjectIds already converted to strings
+
+        Returns:
+            Entity instance
+        """
+        return cls.model_validate(document)
 
     def __eq__(self, other: object) -> bool:
-        """Two entities are equal if they have the same ID."""
-        if not isinstance(other, BaseEntity):
-            return False
-        if self.id is None or other.id is None:
-            return False
-        return self.id == other.id
+        """Two entities are equal if they are of one type and share an ID."""
+        return (
+            self.id is not None
+            and type(other) is type(self)
+            and self.id == other.id
+        )
 
     def __hash__(self) -> int:
-        """Hash based on ID for use in sets and dicts."""
-        return hash(self.id) if self.id else hash(id(self))
+        """
+        Hash based on ID for use in sets and dicts.
+
+        No cache is kept: str caches its own hash, so hashing the ID
+        again is a field read.
+        """
+        return hash(self.id or id(self))
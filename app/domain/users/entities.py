@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 from pydantic import Field, EmailStr
 
-from app.domain.shared.entity import BaseEntity
+from app.domain.shared.entity import BaseEntity, utcnow
 from app.domain.users.value_objects import UserRole
 
 
@@ -29,9 +29,33 @@ class User(BaseEntity):
     oauth_provider: Optional[str] = None
     oauth_provider_id: Optional[str] = None
 
+    @classmethod
+    def from_mongo(cls, document: dict) -> "User":
+        """
+        Build a user from a stored document without re-validating it.
+
+        role is converted to its UserRole member, which is_admin relies
+        on; unknown keys are dropped.
+        """
+        return cls.model_construct(
+            id=document.get("_id"),
+            created_at=document.get("created_at") or utcnow(),
+            name=document["name"],
+            email=document["email"],
+            password=document.get("password"),
+            avatar=document.get("avatar"),
+            role=UserRole(document.get("role") or UserRole.USER.value),
+            reset_password_token=document.get("reset_password_token"),
+            reset_password_token_expire=document.get("reset_password_token_expire"),
+            oauth_provider=document.get("oauth_provider"),
+            oauth_provider_id=document.get("oauth_provider_id")
+        )
+
     def is_admin(self) -> bool:
         """Check if user has admin role."""
-        return self.role == UserRole.ADMIN
+        # role is always a UserRole member after validation, so identity
+        # is enough and skips string comparison
+        return self.role is UserRole.ADMIN
 
     def can_reset_password(self) -> bool:
         """Check if password reset token is valid."""
@@ -39,7 +63,7 @@ class User(BaseEntity):
             return False
         if not self.reset_password_token_expire:
             return False
-        return datetime.utcnow() < self.reset_password_token_expire
+        return utcnow() < self.reset_password_token_expire
 
     def clear_reset_token(self) -> None:
         """Clear password reset token after use."""
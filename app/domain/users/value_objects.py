@@ -20,7 +20,17 @@ class UserRole(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "UserRole":
         """Create UserRole from string value."""
-        try:
-            return cls(value.lower())
-        except ValueError:
-            return cls.USER  # Default to user role
+        role = _ROLES_BY_NAME.get(value)
+        if role is None:
+            # Mixed-case input; anything unknown defaults to user role
+            role = _ROLES_BY_NAME.get(value.lower(), _DEFAULT_ROLE)
+        return role
+
+
+# Roles by lowercase and uppercase value, the spellings seen in practice
+_ROLES_BY_NAME = {
+    **{role.value: role for role in UserRole},
+    **{role.value.upper(): role for role in UserRole},
+}
+
+_DEFAULT_ROLE = UserRole.USER
@@ -0,0 +1,52 @@
+"""
+BSON type codecs for the MongoDB client.
+"""
+from decimal import Decimal
+
+from bson import ObjectId
+from bson.codec_options import TypeCodec, TypeDecoder, TypeRegistry
+from bson.decimal128 import Decimal128
+
+
+class DecimalCodec(TypeCodec):
+    """
+    Store Decimal values as Decimal128 and read them back as float.
+
+    Monetary fields are Decimal on the domain entities, which BSON cannot
+    encode natively. Decoding straight to float means aggregation results
+    and raw documents arrive ready for JSON without a per-field conversion;
+    entities still turn the float back into Decimal on validation.
+    """
+
+    python_type = Decimal
+    bson_type = Decimal128
+
+    def transform_python(self, value: Decimal) -> Decimal128:
+        """Encode a Decimal as Decimal128."""
+        return Decimal128(value)
+
+    def transform_bson(self, value: Decimal128) -> float:
+        """Decode a Decimal128 as float."""
+        return float(value.to_decimal())
+
+
+class ObjectIdAsStrDecoder(TypeDecoder):
+    """
+    Decode ObjectIds as their 24-character hex strings.
+
+    Entity IDs are strings, so converting while the BSON is decoded saves
+    a separate pass over every document read. Only decoding is affected;
+    queries still pass ObjectId values.
+    """
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        """Decode an ObjectId as str."""
+        return str(value)
+
+
+TYPE_REGISTRY = TypeRegistry([DecimalCodec()])
+
+# For repository collections, whose documents become entities
+STR_ID_TYPE_REGISTRY = TypeRegistry([DecimalCodec(), ObjectIdAsStrDecoder()])
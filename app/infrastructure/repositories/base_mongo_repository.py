@@ -4,12 +4,16 @@ Provides common CRUD operations for all MongoDB collections.
 """
 from typing import Generic, TypeVar, Optional, List, Tuple, Type, Any
 from datetime import datetime
+import asyncio
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pydantic import TypeAdapter
+from pymongo import ReturnDocument
 
 from app.domain.shared.entity import BaseEntity
 from app.domain.shared.repository import BaseRepository
+from app.infrastructure.codecs import STR_ID_TYPE_REGISTRY
 from app.core.logging import get_logger
 
 T = TypeVar("T", bound=BaseEntity)
@@ -37,6 +41,11 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
         - Uses dependency injection for database connection
     """
 
+    # Documents in the application's own collections were validated when
+    # written, so reads hydrate through the entity's from_mongo. Set False on
+    # a repository whose collection other systems may also write to.
+    TRUSTED_READS: bool = True
+
     def __init__(
         self,
         database: AsyncIOMotorDatabase,
@@ -54,13 +63,26 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
         self._database = database
         self._collection_name = collection_name
         self._entity_class = entity_class
-        self._collection: AsyncIOMotorCollection = database[collection_name]
+        # Bound once; used for untrusted reads in place of model_validate,
+        # the list form validating a whole result set in one call
+        self._validate = entity_class.__pydantic_validator__.validate_python
+        self._validate_many = TypeAdapter(List[entity_class]).validate_python
+        # ObjectIds are decoded straight to strings, nested ones included
+        self._collection: AsyncIOMotorCollection = database.get_collection(
+            collection_name,
+            codec_options=database.codec_options.with_options(
+                type_registry=STR_ID_TYPE_REGISTRY
+            )
+        )
 
     def _to_entity(self, document: dict) -> T:
         """
         Convert MongoDB document to domain entity.
 
-        Handles ObjectId to string conversion for the _id field.
+        ObjectIds were already decoded as strings by the collection's
+        codec options. Trusted reads go through the entity class's
+        from_mongo, which decides whether to re-validate; untrusted reads
+        are always validated.
 
         Args:
             document: MongoDB document dict
@@ -71,32 +93,27 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
         if document is None:
             return None
 
-        # Convert ObjectId to string
-        if "_id" in document and isinstance(document["_id"], ObjectId):
-            document["_id"] = str(document["_id"])
-
-        # Convert any nested ObjectId fields
-        document = self._convert_object_ids(document)
+        if self.TRUSTED_READS:
+            return self._entity_class.from_mongo(document)
+        return self._validate(document)
 
-        return self._entity_class.model_validate(document)
-
-    def _convert_object_ids(self, data: Any) -> Any:
+    def _to_entities(self, documents: List[dict]) -> List[T]:
         """
-        Recursively convert ObjectId instances to strings.
+        Convert several MongoDB documents to domain entities at once.
+
+        Untrusted reads are validated as one list in a single
+        pydantic-core call rather than document by document.
 
         Args:
-            data: Data to convert (dict, list, or primitive)
+            documents: MongoDB document dicts
 
         Returns:
-            Data with ObjectIds converted to strings
+            Domain entity instances, in document order
         """
-        if isinstance(data, ObjectId):
-            return str(data)
-        elif isinstance(data, dict):
-            return {k: self._convert_object_ids(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._convert_object_ids(item) for item in data]
-        return data
+        if self.TRUSTED_READS:
+            from_mongo = self._entity_class.from_mongo
+            return [from_mongo(document) for document in documents]
+        return self._validate_many(documents)
 
     def _to_document(self, entity: T) -> dict:
         """
@@ -144,9 +161,10 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
             id=str(result.inserted_id)
         )
 
-        # Fetch and return the created document
-        created_doc = await self._collection.find_one({"_id": result.inserted_id})
-        return self._to_entity(created_doc)
+        # The inserted document is exactly what was stored, so it is turned
+        # back into an entity directly rather than read back
+        document["_id"] = str(result.inserted_id)
+        return self._to_entity(document)
 
     async def get_by_id(self, entity_id: str) -> Optional[T]:
         """
@@ -202,20 +220,20 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
         # Remove _id from update data
         update_data = {k: v for k, v in document.items() if k != "_id"}
 
-        result = await self._collection.update_one(
+        # Update and read back the stored document in one round trip
+        updated_doc = await self._collection.find_one_and_update(
             {"_id": object_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
 
         logger.debug(
             "Entity updated",
             collection=self._collection_name,
             id=entity.id,
-            modified_count=result.modified_count
+            found=updated_doc is not None
         )
 
-        # Fetch and return updated document
-        updated_doc = await self._collection.find_one({"_id": object_id})
         return self._to_entity(updated_doc)
 
     async def delete(self, entity_id: str) -> bool:
@@ -255,7 +273,8 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
         Returns:
             List of entities
         """
-        cursor = self._collection.find().skip(skip).limit(limit)
+        # The whole page comes back in the first batch, without a getMore
+        cursor = self._collection.find().skip(skip).limit(limit).batch_size(limit)
         documents = await cursor.to_list(length=limit)
 
         logger.debug(
@@ -266,7 +285,7 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
             limit=limit
         )
 
-        return [self._to_entity(doc) for doc in documents]
+        return self._to_entities(documents)
 
     async def count(self, filter_query: dict | None = None) -> int:
         """
@@ -325,7 +344,8 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
         filter_query: dict | None = None,
         sort: List[Tuple[str, int]] | None = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        projection: dict | None = None
     ) -> List[T]:
         """
         Find multiple entities with optional filtering and sorting.
@@ -335,27 +355,31 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
             sort: List of (field, direction) tuples (1 for asc, -1 for desc)
             skip: Number to skip
             limit: Maximum to return
+            projection: Optional projection; excluded fields fall back to
+                their entity defaults, so only exclude optional fields
 
         Returns:
             List of matching entities
         """
         query = filter_query or {}
-        cursor = self._collection.find(query)
+        cursor = self._collection.find(query, projection)
 
         if sort:
             cursor = cursor.sort(sort)
 
-        cursor = cursor.skip(skip).limit(limit)
+        # The whole page comes back in the first batch, without a getMore
+        cursor = cursor.skip(skip).limit(limit).batch_size(limit)
         documents = await cursor.to_list(length=limit)
 
-        return [self._to_entity(doc) for doc in documents]
+        return self._to_entities(documents)
 
     async def find_with_pagination(
         self,
         filter_query: dict | None = None,
         sort: List[Tuple[str, int]] | None = None,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        projection: dict | None = None
     ) -> Tuple[List[T], int]:
         """
         Find entities with pagination and sorting.
@@ -365,22 +389,46 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
             sort: List of (field, direction) tuples
             skip: Number to skip
             limit: Maximum to return
+            projection: Optional find-style projection for the page
 
         Returns:
             Tuple of (entities list, total count)
         """
         query = filter_query or {}
 
-        # Get total count for pagination
-        total = await self._collection.count_documents(query)
-
-        # Get paginated results
-        entities = await self.find_many(
-            filter_query=query,
-            sort=sort,
-            skip=skip,
-            limit=limit
-        )
+        if query and skip == 0:
+            # First pages are fetched on their own; a short one already
+            # tells the total, so the count is only run for full pages
+            entities = await self.find_many(
+                filter_query=query,
+                sort=sort,
+                skip=skip,
+                limit=limit,
+                projection=projection
+            )
+            if len(entities) < limit:
+                total = len(entities)
+            else:
+                total = await self._collection.count_documents(query)
+        elif query:
+            # Page and total from one $facet aggregation, so the filter is
+            # evaluated once and only one round trip is made
+            entities, total = await self._find_page_and_count(
+                query, sort, skip, limit, projection
+            )
+        else:
+            # An empty filter can use the collection metadata count instead
+            # of a scan; count and page are independent, so run concurrently
+            entities, total = await asyncio.gather(
+                self.find_many(
+                    filter_query=query,
+                    sort=sort,
+                    skip=skip,
+                    limit=limit,
+                    projection=projection
+                ),
+                self._collection.estimated_document_count()
+            )
 
         logger.debug(
             "Paginated query executed",
@@ -393,17 +441,73 @@ class BaseMongoRepository(BaseRepository[T], Generic[T]):
 
         return entities, total
 
-    async def aggregate(self, pipeline: List[dict]) -> List[dict]:
+    async def _find_page_and_count(
+        self,
+        query: dict,
+        sort: List[Tuple[str, Any]] | None,
+        skip: int,
+        limit: int,
+        projection: dict | None
+    ) -> Tuple[List[T], int]:
+        """
+        Run a filtered page query and its count as one $facet aggregation.
+
+        Args:
+            query: Non-empty filter criteria
+            sort: List of (field, direction) tuples; a direction may also
+                be a $meta expression such as a text score
+            skip: Number to skip
+            limit: Maximum to return
+            projection: Optional find-style projection
+
+        Returns:
+            Tuple of (entities list, total count)
+        """
+        page_stages: List[dict] = []
+        if sort:
+            page_stages.append({"$sort": dict(sort)})
+        page_stages += [{"$skip": skip}, {"$limit": limit}]
+
+        if projection:
+            # $project cannot mix exclusions with expressions, so computed
+            # fields such as a text score are added in a separate stage
+            computed = {k: v for k, v in projection.items() if isinstance(v, dict)}
+            plain = {k: v for k, v in projection.items() if not isinstance(v, dict)}
+            if plain:
+                page_stages.append({"$project": plain})
+            if computed:
+                page_stages.append({"$addFields": computed})
+
+        results = await self.aggregate([
+            {"$match": query},
+            {"$facet": {
+                "page": page_stages,
+                "total": [{"$count": "count"}]
+            }}
+        ])
+
+        facet = results[0]
+        total = facet["total"][0]["count"] if facet["total"] else 0
+        return self._to_entities(facet["page"]), total
+
+    async def aggregate(
+        self,
+        pipeline: List[dict],
+        batch_size: Optional[int] = None
+    ) -> List[dict]:
         """
         Execute an aggregation pipeline.
 
         Args:
             pipeline: MongoDB aggregation pipeline
+            batch_size: Documents per server batch; pass the expected
+                result size to receive it in a single round trip
 
         Returns:
             List of aggregation results
         """
-        cursor = self._collection.aggregate(pipeline)
+        options = {"batchSize": batch_size} if batch_size else {}
+        cursor = self._collection.aggregate(pipeline, **options)
         return await cursor.to_list(length=None)
 
     async def update_many(
@@ -139,56 +139,42 @@ class MongoOrderRepository(BaseMongoRepository[Order], OrderRepository):
         if match_stage:
             pipeline.append({"$match": match_stage})
 
-        pipeline.extend([
-            {
-                "$group": {
-                    "_id": None,
-                    "total_orders": {"$sum": 1},
-                    "total_sales": {"$sum": "$total_price"},
-                    "average_order_value": {"$avg": "$total_price"},
-                    "delivered_orders": {
-                        "$sum": {
-                            "$cond": [
-                                {"$eq": ["$order_status", OrderStatus.DELIVERED.value]},
-                                1, 0
-                            ]
-                        }
-                    },
-                    "processing_orders": {
-                        "$sum": {
-                            "$cond": [
-                                {"$eq": ["$order_status", OrderStatus.PROCESSING.value]},
-                                1, 0
-                            ]
-                        }
-                    },
-                    "cancelled_orders": {
-                        "$sum": {
-                            "$cond": [
-                                {"$eq": ["$order_status", OrderStatus.CANCELLED.value]},
-                                1, 0
-                            ]
+        # Totals and per-status counts in one round trip
+        pipeline.append({
+            "$facet": {
+                "totals": [
+                    {
+                        "$group": {
+                            "_id": None,
+                            "total_orders": {"$sum": 1},
+                            "total_sales": {"$sum": "$total_price"},
+                            "average_order_value": {"$avg": "$total_price"}
                         }
                     }
-                }
+                ],
+                "by_status": [
+                    {"$group": {"_id": "$order_status", "count": {"$sum": 1}}}
+                ]
             }
-        ])
+        })
 
         cursor = self._collection.aggregate(pipeline)
         results = await cursor.to_list(length=1)
+        facets = results[0] if results else {}
 
-        if results:
-            stats = results[0]
-            del stats["_id"]
-            return stats
+        totals = facets.get("totals") or [{}]
+        by_status = {
+            row["_id"]: row["count"]
+            for row in facets.get("by_status", [])
+        }
 
         return {
-            "total_orders": 0,
-            "total_sales": 0,
-            "average_order_value": 0,
-            "delivered_orders": 0,
-            "processing_orders": 0,
-            "cancelled_orders": 0
+            "total_orders": totals[0].get("total_orders", 0),
+            "total_sales": totals[0].get("total_sales", 0),
+            "average_order_value": totals[0].get("average_order_value", 0),
+            "delivered_orders": by_status.get(OrderStatus.DELIVERED.value, 0),
+            "processing_orders": by_status.get(OrderStatus.PROCESSING.value, 0),
+            "cancelled_orders": by_status.get(OrderStatus.CANCELLED.value, 0)
         }
 
     async def get_recent_orders(self, limit: int = 10) -> List[Order]:
@@ -235,5 +221,5 @@ class MongoOrderRepository(BaseMongoRepository[Order], OrderRepository):
             {"$sort": {"_id": 1}}
         ]
 
-        cursor = self._collection.aggregate(pipeline)
-        return await cursor.to_list(length=None)
+        # At most one row per day in the window
+        return await self.aggregate(pipeline, batch_size=days + 1)
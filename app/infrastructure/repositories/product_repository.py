@@ -1,20 +1,68 @@
 """
 MongoDB Product repository implementation.
 """
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+import asyncio
 from datetime import datetime
+import re
+from decimal import Decimal
 
 from bson import ObjectId
+from bson.errors import InvalidId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
 
 from app.infrastructure.repositories.base_mongo_repository import BaseMongoRepository
-from app.domain.products.entities import Product
+from app.domain.products.entities import Product, RECENT_REVIEW_CAP
 from app.domain.products.repository import ProductRepository
 from app.domain.products.value_objects import ProductCategory
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Listing views never render reviews, which grow without bound per product
+SUMMARY_PROJECTION = {"reviews": 0}
+
+# Order placement only checks names and stock; primary_image stands in for
+# the images array
+ORDER_CHECK_PROJECTION = {
+    "name": 1,
+    "price": 1,
+    "category": 1,
+    "seller": 1,
+    "stock": 1,
+    "primary_image": 1,
+}
+
+TEXT_SCORE = {"$meta": "textScore"}
+
+# Final update pipeline stage: average rating to one decimal, 0 without reviews
+RATINGS_STAGE = {"$set": {"ratings": {"$cond": [
+    {"$gt": ["$num_of_reviews", 0]},
+    {"$round": [{"$divide": ["$rating_sum", "$num_of_reviews"]}, 1]},
+    0
+]}}}
+
+# Stored rating_sum, or the embedded reviews' sum on products stored before
+# rating_sum was kept (those embed every review)
+STORED_RATING_SUM = {"$ifNull": ["$rating_sum", {"$sum": "$reviews.rating"}]}
+
+
+def _embedded_reviews(user_id: str, own: bool) -> dict:
+    """Expression selecting the embedded reviews by, or not by, a user."""
+    return {"$filter": {
+        "input": {"$ifNull": ["$reviews", []]},
+        "cond": {"$eq" if own else "$ne": ["$$this.user", user_id]}
+    }}
+
+
+def _embedded_rating(user_id: str) -> dict:
+    """Expression for the user's embedded review rating, 0 if none."""
+    return {"$sum": {"$map": {
+        "input": _embedded_reviews(user_id, own=True),
+        "in": "$$this.rating"
+    }}}
+
 
 class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
     """
@@ -36,6 +84,26 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
             collection_name="products",
             entity_class=Product
         )
+        # Full review history; products embed only the most recent reviews
+        self._reviews = database["product_reviews"]
+
+    def _to_document(self, entity: Product) -> dict:
+        """
+        Convert a product to a MongoDB document.
+
+        Prices are held in cents on the entity but stored as a Decimal
+        price, so existing documents and price filters are unaffected.
+        """
+        document = super()._to_document(entity)
+        document["price"] = Decimal(document.pop("price_cents")).scaleb(-2)
+        return document
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete a product together with its review history."""
+        deleted = await super().delete(entity_id)
+        if deleted:
+            await self._reviews.delete_many({"product_id": ObjectId(entity_id)})
+        return deleted
 
     async def search(
         self,
@@ -46,21 +114,33 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
         """
         Search products by keyword using text search.
 
-        Uses MongoDB text index for efficient searching.
+        Uses the (name, description) text index, best match first. Keywords
+        with * or ? wildcards need partial matching, which the text index
+        cannot do, so they fall back to a case-insensitive regex scan.
         """
-        # Use regex for partial matching (text search requires full words)
-        query = {
-            "$or": [
-                {"name": {"$regex": keyword, "$options": "i"}},
-                {"description": {"$regex": keyword, "$options": "i"}}
-            ]
-        }
+        if "*" in keyword or "?" in keyword:
+            pattern = "".join(
+                ".*" if char == "*" else "." if char == "?" else re.escape(char)
+                for char in keyword
+            )
+            return await self.find_with_pagination(
+                filter_query={
+                    "$or": [
+                        {"name": {"$regex": pattern, "$options": "i"}},
+                        {"description": {"$regex": pattern, "$options": "i"}}
+                    ]
+                },
+                sort=[("ratings", -1)],
+                skip=skip,
+                limit=limit
+            )
 
         return await self.find_with_pagination(
-            filter_query=query,
-            sort=[("ratings", -1)],
+            filter_query={"$text": {"$search": keyword}},
+            sort=[("score", TEXT_SCORE), ("ratings", -1)],
             skip=skip,
-            limit=limit
+            limit=limit,
+            projection={"score": TEXT_SCORE}
         )
 
     async def get_by_category(
@@ -156,6 +236,115 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
 
         return False
 
+    async def get_by_ids(self, product_ids: List[str]) -> List[Product]:
+        """
+        Get several products in one query, for order stock checks.
+
+        Only the scalar fields needed there are loaded; description,
+        images and reviews are left out. Invalid or unknown IDs are
+        skipped.
+        """
+        object_ids = []
+        for product_id in product_ids:
+            try:
+                object_ids.append(ObjectId(product_id))
+            except (InvalidId, TypeError):
+                continue
+
+        if not object_ids:
+            return []
+
+        return await self.find_many(
+            filter_query={"_id": {"$in": object_ids}},
+            limit=len(object_ids),
+            projection=ORDER_CHECK_PROJECTION
+        )
+
+    async def bulk_update_stock(self, changes: Dict[str, int]) -> int:
+        """
+        Apply several stock changes in a single round trip.
+
+        Each change is guarded like update_stock, so a decrement only
+        applies while enough stock remains.
+
+        Args:
+            changes: Mapping of product ID to quantity change
+
+        Returns:
+            Number of products whose stock was updated
+        """
+        operations = [
+            UpdateOne(
+                {"_id": ObjectId(product_id), "stock": {"$gte": -change if change < 0 else 0}},
+                {"$inc": {"stock": change}}
+            )
+            for product_id, change in changes.items()
+        ]
+
+        if not operations:
+            return 0
+
+        result = await self._collection.bulk_write(operations, ordered=False)
+
+        logger.debug(
+            "Stock bulk updated",
+            requested=len(operations),
+            modified=result.modified_count
+        )
+
+        return result.modified_count
+
+    async def reserve_stock(self, quantities: Dict[str, int]) -> List[str]:
+        """
+        Take stock for several products, all or nothing.
+
+        The guarded decrements run concurrently so each result is known.
+        If any product lacks stock, the decrements that did apply are
+        put back with one compensating bulk write.
+
+        Args:
+            quantities: Mapping of product ID to quantity to take
+
+        Returns:
+            IDs of products that lacked stock; empty if all were reserved
+        """
+        product_ids = list(quantities)
+        results = await asyncio.gather(*(
+            self._collection.update_one(
+                {"_id": ObjectId(product_id), "stock": {"$gte": quantities[product_id]}},
+                {"$inc": {"stock": -quantities[product_id]}}
+            )
+            for product_id in product_ids
+        ))
+
+        applied = {}
+        short = []
+        for product_id, result in zip(product_ids, results):
+            if result.modified_count:
+                applied[product_id] = quantities[product_id]
+            else:
+                short.append(product_id)
+
+        if short and applied:
+            result = await self._collection.bulk_write(
+                [
+                    UpdateOne({"_id": ObjectId(product_id)}, {"$inc": {"stock": quantity}})
+                    for product_id, quantity in applied.items()
+                ],
+                ordered=False
+            )
+            if result.modified_count != len(applied):
+                logger.warning(
+                    "Stock reservation rollback incomplete",
+                    short=short,
+                    released=result.modified_count,
+                    expected=len(applied)
+                )
+            else:
+                logger.debug("Stock reservation rolled back", short=short, released=len(applied))
+
+        return short
+
     async def add_review(
         self,
         product_id: str,
@@ -166,48 +355,64 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
         """
         Add or update a review for a product.
 
-        If user already has a review, it will be updated.
-        Recalculates average rating after adding review.
+        If user already has a review, it will be updated. The review is
+        upserted into product_reviews; the product document keeps only the
+        newest RECENT_REVIEW_CAP reviews and is updated with running
+        totals, so the write does not grow with the number of reviews.
         """
         try:
             object_id = ObjectId(product_id)
         except Exception:
             return False
 
-        # First, try to update existing review
-        result = await self._collection.update_one(
+        now = datetime.utcnow()
+        previous = await self._reviews.find_one_and_update(
+            {"product_id": object_id, "user": user_id},
             {
-                "_id": object_id,
-                "reviews.user": user_id
+                "$set": {"rating": rating, "comment": comment},
+                "$setOnInsert": {"_id": ObjectId(), "created_at": now}
             },
-            {
-                "$set": {
-                    "reviews.$.rating": rating,
-                    "reviews.$.comment": comment
-                }
-            }
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
         )
 
-        if result.matched_count == 0:
-            # No existing review, add new one
-            review = {
-                "_id": str(ObjectId()),
-                "user": user_id,
-                "rating": rating,
-                "comment": comment,
-                "created_at": datetime.utcnow()
-            }
-
-            result = await self._collection.update_one(
-                {"_id": object_id},
-                {
-                    "$push": {"reviews": review},
-                    "$inc": {"num_of_reviews": 1}
-                }
-            )
+        review = {
+            "_id": str(previous["_id"]) if previous else str(ObjectId()),
+            "user": user_id,
+            "rating": rating,
+            "comment": comment,
+            "created_at": previous["created_at"] if previous else now
+        }
 
-        # Recalculate average rating
-        await self._recalculate_rating(product_id)
+        # Products stored before product_reviews existed may hold the user's
+        # review only in the embedded array
+        if previous:
+            old_rating = previous["rating"]
+            count_change = 0
+        else:
+            old_rating = _embedded_rating(user_id)
+            count_change = {"$cond": [
+                {"$gt": [{"$size": _embedded_reviews(user_id, own=True)}, 0]}, 0, 1
+            ]}
+
+        await self._collection.update_one(
+            {"_id": object_id},
+            [
+                {"$set": {
+                    "reviews": {"$slice": [
+                        {"$concatArrays": [_embedded_reviews(user_id, own=False), [review]]},
+                        -RECENT_REVIEW_CAP
+                    ]},
+                    "rating_sum": {"$add": [
+                        STORED_RATING_SUM, rating, {"$multiply": [old_rating, -1]}
+                    ]},
+                    "num_of_reviews": {"$add": [
+                        {"$ifNull": ["$num_of_reviews", 0]}, count_change
+                    ]}
+                }},
+                RATINGS_STAGE
+            ]
+        )
 
         logger.debug(
             "Review added/updated",
@@ -222,22 +427,47 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
         product_id: str,
         user_id: str
     ) -> bool:
-        """Remove a user's review from a product."""
+        """
+        Remove a user's review from a product.
+
+        The review is deleted from product_reviews, then pulled from the
+        product's embedded reviews while the running totals are adjusted
+        in a single pipeline update. Products the user has not reviewed
+        are left untouched.
+        """
         try:
             object_id = ObjectId(product_id)
         except Exception:
             return False
 
+        removed = await self._reviews.find_one_and_delete(
+            {"product_id": object_id, "user": user_id}
+        )
+
+        if removed:
+            query = {"_id": object_id}
+            removed_rating = removed["rating"]
+        else:
+            # Only products stored before product_reviews existed can still
+            # hold a review that is not in the collection
+            query = {"_id": object_id, "reviews.user": user_id}
+            removed_rating = _embedded_rating(user_id)
+
         result = await self._collection.update_one(
-            {"_id": object_id},
-            {
-                "$pull": {"reviews": {"user": user_id}},
-                "$inc": {"num_of_reviews": -1}
-            }
+            query,
+            [
+                {"$set": {
+                    "reviews": _embedded_reviews(user_id, own=False),
+                    "rating_sum": {"$subtract": [STORED_RATING_SUM, removed_rating]},
+                    "num_of_reviews": {"$max": [
+                        {"$subtract": [{"$ifNull": ["$num_of_reviews", 1]}, 1]}, 0
+                    ]}
+                }},
+                RATINGS_STAGE
+            ]
         )
 
         if result.modified_count > 0:
-            await self._recalculate_rating(product_id)
             logger.debug(
                 "Review removed",
                 product_id=product_id,
@@ -247,48 +477,45 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
 
         return False
 
-    async def _recalculate_rating(self, product_id: str) -> None:
-        """Recalculate and update product's average rating."""
-        try:
-            object_id = ObjectId(product_id)
-        except Exception:
-            return
-
-        # Use aggregation to calculate average
-        pipeline = [
-            {"$match": {"_id": object_id}},
-            {"$project": {
-                "ratings": {
-                    "$cond": {
-                        "if": {"$eq": [{"$size": "$reviews"}, 0]},
-                        "then": 0,
-                        "else": {"$avg": "$reviews.rating"}
-                    }
-                }
-            }}
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        result = await cursor.to_list(length=1)
-
-        if result:
-            new_rating = round(result[0].get("ratings", 0), 1)
-            await self._collection.update_one(
-                {"_id": object_id},
-                {"$set": {"ratings": new_rating}}
-            )
-
     async def get_admin_products(
         self,
         skip: int = 0,
         limit: int = 10
     ) -> Tuple[List[Product], int]:
-        """Get all products for admin panel."""
+        """Get all products for admin panel, without reviews."""
         return await self.find_with_pagination(
             filter_query={},
             sort=[("created_at", -1)],
             skip=skip,
-            limit=limit
+            limit=limit,
+            projection=SUMMARY_PROJECTION
+        )
+
+    async def get_products_summary(
+        self,
+        keyword: str | None = None,
+        category: str | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        min_rating: float | None = None,
+        skip: int = 0,
+        limit: int = 10
+    ) -> Tuple[List[Product], int]:
+        """
+        Filter products for listing views.
+
+        Same as filter_products but without the embedded reviews; the
+        returned entities must not be written back.
+        """
+        return await self.filter_products(
+            keyword=keyword,
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            min_rating=min_rating,
+            skip=skip,
+            limit=limit,
+            projection=SUMMARY_PROJECTION
         )
 
     async def filter_products(
@@ -301,7 +528,8 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
         sort_by: str = "created_at",
         sort_order: int = -1,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        projection: dict | None = None
     ) -> Tuple[List[Product], int]:
         """
         Filter products with multiple criteria.
@@ -309,13 +537,13 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
         This is the main method for product listing with filters.
         """
         query = {}
+        sort = [(sort_by, sort_order)]
 
-        # Keyword search
+        # Keyword search via the (name, description) text index, best match first
         if keyword:
-            query["$or"] = [
-                {"name": {"$regex": keyword, "$options": "i"}},
-                {"description": {"$regex": keyword, "$options": "i"}}
-            ]
+            query["$text"] = {"$search": keyword}
+            sort.insert(0, ("score", TEXT_SCORE))
+            projection = {**(projection or {}), "score": TEXT_SCORE}
 
         # Category filter
         if category:
@@ -335,7 +563,8 @@ class MongoProductRepository(BaseMongoRepository[Product], ProductRepository):
 
         return await self.find_with_pagination(
             filter_query=query,
-            sort=[(sort_by, sort_order)],
+            sort=sort,
             skip=skip,
-            limit=limit
+            limit=limit,
+            projection=projection
         )
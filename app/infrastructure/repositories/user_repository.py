@@ -1,18 +1,27 @@
 """
 MongoDB User repository implementation.
 """
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.infrastructure.repositories.base_mongo_repository import BaseMongoRepository
 from app.domain.users.entities import User
 from app.domain.users.repository import UserRepository
+from app.domain.users.value_objects import UserRole
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fields exposed by admin user listings. Together with LIST_SORT these are
+# all in the admin_list_cover index, so listings are served from the index.
+PUBLIC_PROJECTION = {"name": 1, "email": 1, "avatar": 1, "role": 1, "created_at": 1}
+
+# Newest first, with _id breaking ties so keyset pages are stable
+LIST_SORT = [("created_at", -1), ("_id", -1)]
+
 
 class MongoUserRepository(BaseMongoRepository[User], UserRepository):
     """
@@ -35,6 +44,61 @@ class MongoUserRepository(BaseMongoRepository[User], UserRepository):
             entity_class=User
         )
 
+    async def list_public_rows(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        created_at: Optional[datetime] = None,
+        last_id: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Get public user fields as plain dicts, newest first.
+
+        Rows skip entity validation and are ready to serialize as-is.
+        Passing the (created_at, _id) of the last row already seen pages
+        by keyset instead of skip, so deep pages cost the same as the first.
+
+        Args:
+            skip: Number to skip
+            limit: Maximum to return
+            created_at: Creation time of the last user already seen
+            last_id: ID of the last user already seen
+
+        Returns:
+            List of dicts with id, name, email, avatar, role, created_at
+        """
+        query = {}
+        if last_id is not None:
+            query = {
+                "$or": [
+                    {"created_at": {"$lt": created_at}},
+                    {"created_at": created_at, "_id": {"$lt": ObjectId(last_id)}}
+                ]
+            }
+
+        cursor = (
+            self._collection.find(query, PUBLIC_PROJECTION)
+            .sort(LIST_SORT)
+            .skip(skip)
+            .limit(limit)
+        )
+
+        return [
+            {
+                "id": str(doc["_id"]),
+                "name": doc.get("name"),
+                "email": doc.get("email"),
+                "avatar": doc.get("avatar"),
+                "role": doc.get("role", UserRole.USER.value),
+                "created_at": doc.get("created_at")
+            }
+            async for doc in cursor
+        ]
+
+    async def estimated_count(self) -> int:
+        """Estimated number of users, from collection metadata."""
+        return await self._collection.estimated_document_count()
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Find user by email address.
@@ -197,10 +261,10 @@ class MongoUserRepository(BaseMongoRepository[User], UserRepository):
         result = await self._collection.update_one(
             {"_id": ObjectId(user_id)},
             {
-                "$set": {
-                    "password": hashed_password,
-                    "reset_password_token": None,
-                    "reset_password_token_expire": None
+                "$set": {"password": hashed_password},
+                "$unset": {
+                    "reset_password_token": "",
+                    "reset_password_token_expire": ""
                 }
             }
         )
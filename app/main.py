@@ -16,6 +16,7 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.core.config import settings
@@ -27,6 +28,7 @@ from app.middleware.correlation_id import CorrelationIdMiddleware
 
 # Import API routers
 from app.api.v1 import api_router
+from app.api.v1.dependencies import init_services, reset_services
 
 logger = get_logger(__name__)
 
@@ -37,8 +39,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize database, configure logging
-    - Shutdown: Close database connections
+    - Startup: Initialize database, configure logging, build services
+    - Shutdown: Release services, close database connections
 
     This is the modern FastAPI way to handle startup/shutdown
     instead of deprecated @app.on_event decorators.
@@ -56,12 +58,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Initialize database connection and create indexes
     await init_database()
 
+    # Build repository/service singletons shared by all requests
+    init_services(app)
+
     logger.info("Application startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down SkyCart API")
+    reset_services(app)
     await close_database()
     logger.info("Application shutdown complete")
 
@@ -83,13 +89,15 @@ def create_application() -> FastAPI:
         docs_url="/api/docs" if settings.DEBUG else None,
         redoc_url="/api/redoc" if settings.DEBUG else None,
         openapi_url="/api/openapi.json" if settings.DEBUG else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
-    # Configure CORS
+    # Configure CORS. CORSMiddleware tests each request's Origin with `in`,
+    # so hand it a set built once rather than the origins tuple.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
+        allow_origins=frozenset(settings.CORS_ORIGINS),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
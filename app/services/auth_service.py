@@ -5,11 +5,11 @@ Handles user authentication, registration, and password management.
 from datetime import datetime, timedelta
 from typing import Optional
 import secrets
-import hashlib
 
 from app.core.config import settings
 from app.core.security import (
     hash_password,
+    hash_password_reset_token,
     verify_password,
     create_access_token,
     decode_token,
@@ -157,7 +157,7 @@ class AuthService:
 
         # Generate reset token
         reset_token = secrets.token_urlsafe(32)
-        hashed_token = hashlib.sha256(reset_token.encode()).hexdigest()
+        hashed_token = hash_password_reset_token(reset_token)
         expire_at = datetime.utcnow() + timedelta(minutes=30)
 
         # Save token to user
@@ -190,7 +190,7 @@ class AuthService:
             ValidationError: If token is invalid or expired
         """
         # Hash the token to match stored version
-        hashed_token = hashlib.sha256(token.encode()).hexdigest()
+        hashed_token = hash_password_reset_token(token)
 
         # Find user with valid token
         user = await self._user_repo.get_by_reset_token(hashed_token)
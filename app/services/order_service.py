@@ -2,7 +2,7 @@
 Order service.
 Handles order management and processing.
 """
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 from decimal import Decimal
 
@@ -106,12 +106,21 @@ class OrderService:
         Raises:
             ValidationError: If items unavailable
         """
-        # Validate stock availability
+        # Total quantity per product, so repeated lines are checked together
+        quantities: Dict[str, int] = {}
         for item in order_items:
-            product = await self._product_repo.get_by_id(item["product"])
+            quantities[item["product"]] = quantities.get(item["product"], 0) + item["quantity"]
+
+        # Validate stock availability with a single query
+        products = {
+            product.id: product
+            for product in await self._product_repo.get_by_ids(list(quantities))
+        }
+        for product_id, quantity in quantities.items():
+            product = products.get(product_id)
             if not product:
-                raise ValidationError(f"Product {item['product']} not found")
-            if product.stock < item["quantity"]:
+                raise ValidationError(f"Product {product_id} not found")
+            if product.stock < quantity:
                 raise ValidationError(
                     f"Insufficient stock for {product.name}. "
                     f"Available: {product.stock}"
@@ -154,16 +163,24 @@ class OrderService:
             order_status=OrderStatus.PROCESSING
         )
 
-        # Create order
-        created_order = await self._order_repo.create(order)
-
-        # Reduce stock for each item
-        for item in order_items:
-            await self._product_repo.update_stock(
-                item["product"],
-                -item["quantity"]
+        # Reserve stock before the order exists, so a product that sold out
+        # since the check above leaves nothing behind
+        short = await self._product_repo.reserve_stock(quantities)
+        if short:
+            current = await self._product_repo.get_by_ids(short[:1])
+            product = current[0] if current else products[short[0]]
+            raise ValidationError(
+                f"Insufficient stock for {product.name}. "
+                f"Available: {product.stock}"
             )
 
+        # Create order, returning the stock if the insert fails
+        try:
+            created_order = await self._order_repo.create(order)
+        except Exception:
+            await self._product_repo.bulk_update_stock(quantities)
+            raise
+
         logger.info(
             "Order created",
             order_id=created_order.id,
@@ -250,11 +267,10 @@ class OrderService:
             raise ValidationError("Order cannot be cancelled")
 
         # Restore stock
+        restored: Dict[str, int] = {}
         for item in order.order_items:
-            await self._product_repo.update_stock(
-                item.product,
-                item.quantity
-            )
+            restored[item.product] = restored.get(item.product, 0) + item.quantity
+        await self._product_repo.bulk_update_stock(restored)
 
         await self._order_repo.update_status(order_id, OrderStatus.CANCELLED)
 
@@ -2,7 +2,8 @@
 Payment service.
 Handles Stripe payment processing.
 """
-from typing import Optional
+from typing import Any, Callable, Optional
+import asyncio
 import stripe
 
 from app.core.config import settings
@@ -27,12 +28,20 @@ class PaymentService:
     Design Notes:
     - Uses Stripe Payment Intents API for SCA compliance
     - All amounts are in cents (smallest currency unit)
+    - The Stripe SDK is blocking, so calls run in worker threads with a
+      bounded number in flight to keep the event loop and thread pool free
     """
 
     def __init__(self):
         """Initialize payment service."""
         if not settings.STRIPE_SECRET_KEY:
             logger.warning("Stripe secret key not configured")
+        self._stripe_slots = asyncio.Semaphore(settings.STRIPE_MAX_CONCURRENCY)
+
+    async def _call_stripe(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking Stripe SDK call in a worker thread."""
+        async with self._stripe_slots:
+            return await asyncio.to_thread(func, *args, **kwargs)
 
     async def create_payment_intent(
         self,
@@ -55,7 +64,8 @@ class PaymentService:
             PaymentError: If Stripe request fails
         """
         try:
-            intent = stripe.PaymentIntent.create(
+            intent = await self._call_stripe(
+                stripe.PaymentIntent.create,
                 amount=amount,
                 currency=currency,
                 metadata=metadata or {},
@@ -91,7 +101,10 @@ class PaymentService:
             PaymentIntent details
         """
         try:
-            intent = stripe.PaymentIntent.retrieve(payment_intent_id)
+            intent = await self._call_stripe(
+                stripe.PaymentIntent.retrieve,
+                payment_intent_id
+            )
 
             return {
                 "id": intent.id,
@@ -119,7 +132,10 @@ class PaymentService:
             Confirmation result
         """
         try:
-            intent = stripe.PaymentIntent.confirm(payment_intent_id)
+            intent = await self._call_stripe(
+                stripe.PaymentIntent.confirm,
+                payment_intent_id
+            )
 
             logger.info(
                 "Payment confirmed",
@@ -167,7 +183,7 @@ class PaymentService:
             if reason:
                 refund_params["reason"] = reason
 
-            refund = stripe.Refund.create(**refund_params)
+            refund = await self._call_stripe(stripe.Refund.create, **refund_params)
 
             logger.info(
                 "Refund created",
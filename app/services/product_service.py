@@ -3,8 +3,9 @@ Product service.
 Handles product management and queries.
 """
 from typing import Optional, List, Tuple
-from decimal import Decimal
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.exceptions import NotFoundError, ValidationError
 from app.core.logging import get_logger
 from app.domain.products.entities import Product, ProductImage, ProductReview
@@ -28,6 +29,11 @@ class ProductService:
     def __init__(self, product_repository: MongoProductRepository):
         """Initialize product service."""
         self._product_repo = product_repository
+        # Public listing pages keyed by filter tuple; cleared on product writes
+        self._list_cache: TTLCache[Tuple[List[Product], int]] = TTLCache(
+            maxsize=settings.PRODUCT_LIST_CACHE_MAX_SIZE,
+            ttl=settings.PRODUCT_LIST_CACHE_TTL_SECONDS
+        )
 
     async def get_product(self, product_id: str) -> Product:
         """
@@ -62,6 +68,9 @@ class ProductService:
         """
         Get products with filtering and pagination.
 
+        Products are loaded without reviews, for listing views. Results
+        are cached briefly per filter combination.
+
         Args:
             keyword: Search keyword
             category: Category filter
@@ -74,9 +83,19 @@ class ProductService:
         Returns:
             Tuple of (products, total count)
         """
+        # No product can match an unknown category; answer without a query
+        # or a cache entry
+        if category and category not in ProductCategory.values_set():
+            return [], 0
+
+        cache_key = (keyword, category, min_price, max_price, min_rating, page, limit)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         skip = (page - 1) * limit
 
-        products, total = await self._product_repo.filter_products(
+        products, total = await self._product_repo.get_products_summary(
             keyword=keyword,
             category=category,
             min_price=min_price,
@@ -86,8 +105,14 @@ class ProductService:
             limit=limit
         )
 
+        self._list_cache.set(cache_key, (products, total))
+
         return products, total
 
+    def invalidate_listings(self) -> None:
+        """Drop cached product listings after a product changes."""
+        self._list_cache.clear()
+
     async def create_product(
         self,
         name: str,
@@ -132,6 +157,7 @@ class ProductService:
         )
 
         created_product = await self._product_repo.create(product)
+        self.invalidate_listings()
 
         logger.info(
             "Product created",
@@ -183,12 +209,13 @@ class ProductService:
         if stock is not None:
             product.stock = stock
         if images is not None:
-            product.images = [
+            product.set_images([
                 ProductImage(image=img.get("image", img))
                 for img in images
-            ]
+            ])
 
         updated_product = await self._product_repo.update(product)
+        self.invalidate_listings()
 
         logger.info("Product updated", product_id=product_id)
 
@@ -210,6 +237,7 @@ class ProductService:
         success = await self._product_repo.delete(product_id)
 
         if success:
+            self.invalidate_listings()
             logger.info("Product deleted", product_id=product_id)
 
         return success
@@ -242,6 +270,7 @@ class ProductService:
             rating=rating,
             comment=comment
         )
+        self.invalidate_listings()
 
         logger.info(
             "Review added",
@@ -269,6 +298,7 @@ class ProductService:
         success = await self._product_repo.remove_review(product_id, user_id)
 
         if success:
+            self.invalidate_listings()
             logger.info(
                 "Review deleted",
                 product_id=product_id,
@@ -312,7 +342,7 @@ class ProductService:
         limit: int = 10
     ) -> Tuple[List[Product], int]:
         """
-        Get all products for admin.
+        Get all products for admin, without reviews.
 
         Args:
             page: Page number
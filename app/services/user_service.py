@@ -3,8 +3,15 @@ User service.
 Handles user management operations.
 """
 from typing import Optional, List, Tuple
+from datetime import datetime
+import asyncio
+import base64
 
-from app.core.exceptions import NotFoundError, ConflictError
+from bson import ObjectId
+
+from app.core.cache import GenerationCounter, TTLCache
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, ConflictError, ValidationError
 from app.core.logging import get_logger
 from app.domain.users.entities import User
 from app.domain.users.value_objects import UserRole
@@ -12,6 +19,39 @@ from app.infrastructure.repositories.user_repository import MongoUserRepository
 
 logger = get_logger(__name__)
 
+_PAGE_CACHE_MAX_SIZE = 256
+
+# Background next-page loads allowed at once; extra requests skip prefetching
+_PREFETCH_CONCURRENCY = 2
+
+# Bumped by every user write through UserService; caches outside the service
+# that hold users (e.g. authenticated users) stamp entries with it
+user_generations = GenerationCounter()
+
+
+def encode_user_cursor(row: dict) -> str:
+    """Encode a user row's (created_at, id) list position as an opaque cursor."""
+    created_at = row["created_at"].isoformat() if row["created_at"] else ""
+    raw = f"{created_at}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_user_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """
+    Decode a cursor produced by encode_user_cursor.
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, user_id = raw.split("|", 1)
+        if not ObjectId.is_valid(user_id):
+            raise ValueError(user_id)
+        return (datetime.fromisoformat(created_at) if created_at else None), user_id
+    except ValueError:
+        raise ValidationError("Invalid cursor")
+
 
 class UserService:
     """
@@ -31,6 +71,29 @@ class UserService:
     def __init__(self, user_repository: MongoUserRepository):
         """Initialize user service."""
         self._user_repo = user_repository
+        # Profiles by user ID; dropped on every write through this service
+        self._profile_cache: TTLCache[User] = TTLCache(
+            maxsize=settings.PROFILE_CACHE_MAX_SIZE,
+            ttl=settings.PROFILE_CACHE_TTL_SECONDS
+        )
+        # Admin list pages by (skip, limit), including prefetched next pages
+        self._page_cache: TTLCache[Tuple[List[dict], int]] = TTLCache(
+            maxsize=_PAGE_CACHE_MAX_SIZE,
+            ttl=settings.USER_PAGE_CACHE_TTL_SECONDS
+        )
+        # Bumped by every write; page loads that started before a write
+        # do not cache their rows
+        self._page_generation = 0
+        self._prefetch_slots = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+        # Running prefetches by (skip, limit)
+        self._prefetch_tasks: dict[Tuple[int, int], asyncio.Task] = {}
+
+    def _invalidate(self, user_id: str) -> None:
+        """Drop cached data that may include the given user."""
+        user_generations.bump(user_id)
+        self._profile_cache.pop(user_id)
+        self._page_cache.clear()
+        self._page_generation += 1
 
     async def get_user_by_id(self, user_id: str) -> User:
         """
@@ -52,6 +115,29 @@ class UserService:
 
         return user
 
+    async def get_profile(self, user_id: str) -> User:
+        """
+        Get a user's own profile, cached briefly.
+
+        The returned entity is shared between requests and must not be
+        modified; writes go through get_user_by_id.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            User entity
+
+        Raises:
+            NotFoundError: If user not found
+        """
+        user = self._profile_cache.get(user_id)
+        if user is None:
+            user = await self.get_user_by_id(user_id)
+            self._profile_cache.set(user_id, user)
+
+        return user
+
     async def get_user_profile(self, user_id: str) -> dict:
         """
         Get user profile for API response.
@@ -62,7 +148,7 @@ class UserService:
         Returns:
             User profile dict (excludes sensitive data)
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self.get_profile(user_id)
         return user.to_public_dict()
 
     async def update_profile(
@@ -103,6 +189,7 @@ class UserService:
             user.avatar = avatar
 
         updated_user = await self._user_repo.update(user)
+        self._invalidate(user_id)
 
         logger.info("User profile updated", user_id=user_id)
 
@@ -120,6 +207,7 @@ class UserService:
             True if updated
         """
         success = await self._user_repo.update_avatar(user_id, avatar_url)
+        self._invalidate(user_id)
 
         if success:
             logger.info("Avatar updated", user_id=user_id)
@@ -132,23 +220,102 @@ class UserService:
         self,
         skip: int = 0,
         limit: int = 10
-    ) -> Tuple[List[User], int]:
+    ) -> Tuple[List[dict], int]:
         """
         Get all users (admin only).
 
+        Returns public fields as plain dicts rather than entities, since
+        the list is only ever serialized. The total comes from collection
+        metadata (estimated_document_count) and is fetched alongside the
+        page rather than by scanning the collection.
+
+        Pages are cached briefly, and the following page is prefetched in
+        the background so paging forward is usually served from memory.
+
         Args:
             skip: Number to skip
             limit: Maximum to return
 
         Returns:
-            Tuple of (users, total count)
+            Tuple of (user rows, total count)
         """
-        return await self._user_repo.find_with_pagination(
-            filter_query={},
-            sort=[("created_at", -1)],
-            skip=skip,
-            limit=limit
+        page = self._page_cache.get((skip, limit))
+        if page is None:
+            page = await self._load_user_page(skip, limit)
+
+        rows, total = page
+        if skip + limit < total:
+            self._prefetch_user_page(skip + limit, limit)
+
+        return rows, total
+
+    async def _load_user_page(self, skip: int, limit: int) -> Tuple[List[dict], int]:
+        """Query one admin list page and cache it unless a write happened meanwhile."""
+        generation = self._page_generation
+        rows, total = await asyncio.gather(
+            self._user_repo.list_public_rows(skip=skip, limit=limit),
+            self._user_repo.estimated_count()
         )
+        if generation == self._page_generation:
+            self._page_cache.set((skip, limit), (rows, total))
+        return rows, total
+
+    def _prefetch_user_page(self, skip: int, limit: int) -> None:
+        """Load the likely next admin list page in the background."""
+        key = (skip, limit)
+        if (
+            self._prefetch_slots.locked()
+            or key in self._prefetch_tasks
+            or self._page_cache.get(key) is not None
+        ):
+            return
+
+        async def prefetch() -> None:
+            async with self._prefetch_slots:
+                try:
+                    await self._load_user_page(skip, limit)
+                except Exception as e:
+                    logger.warning("User page prefetch failed", skip=skip, error=str(e))
+
+        task = asyncio.create_task(prefetch())
+        self._prefetch_tasks[key] = task
+        task.add_done_callback(lambda _: self._prefetch_tasks.pop(key, None))
+
+    async def get_users_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get users after a cursor (admin only).
+
+        Same ordering and rows as get_all_users, but the cost does not
+        grow with page depth.
+
+        Args:
+            cursor: Cursor from a previous page; None starts from the newest
+            limit: Maximum to return
+
+        Returns:
+            Tuple of (user rows, next cursor or None on the last page)
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        created_at, last_id = decode_user_cursor(cursor) if cursor else (None, None)
+
+        # One extra row tells whether another page follows
+        rows = await self._user_repo.list_public_rows(
+            limit=limit + 1,
+            created_at=created_at,
+            last_id=last_id
+        )
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, encode_user_cursor(rows[-1])
+
+        return rows, None
 
     async def admin_update_user(
         self,
@@ -183,6 +350,7 @@ class UserService:
             user.role = UserRole(role)
 
         updated_user = await self._user_repo.update(user)
+        self._invalidate(user_id)
 
         logger.info(
             "Admin updated user",
@@ -206,6 +374,7 @@ class UserService:
         await self.get_user_by_id(user_id)
 
         success = await self._user_repo.delete(user_id)
+        self._invalidate(user_id)
 
         if success:
             logger.info("User deleted", user_id=user_id)
@@ -1,9 +1,20 @@
 """
 Authentication endpoint tests.
 """
+import asyncio
+from typing import Optional
+
 import pytest
+from bson import ObjectId
+from fastapi import HTTPException
 from httpx import AsyncClient
 
+from app.api.v1 import dependencies
+from app.core.security import create_access_token
+from app.domain.users.entities import User
+from app.services.auth_service import AuthService
+from app.services.user_service import user_generations
+
 
 @pytest.mark.asyncio
 async def test_register_user(client: AsyncClient):
@@ -108,3 +119,82 @@ async def test_unauthorized_access(client: AsyncClient):
     response = await client.get("/api/v1/auth/me")
 
     assert response.status_code in [401, 403]
+
+
+class _CountingUserRepository:
+    """In-memory user lookups that count database round trips."""
+
+    def __init__(self, *users: User):
+        self._users = {user.id: user for user in users}
+        self.lookups = 0
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        self.lookups += 1
+        await asyncio.sleep(0)
+        return self._users.get(user_id)
+
+
+def _auth_fixture() -> tuple:
+    """Fresh auth cache, a known user with a token, and its repository."""
+    dependencies._auth_cache.clear()
+    user = User(
+        id=str(ObjectId()),
+        name="Cached User",
+        email="cached@example.com",
+        password="password123"
+    )
+    repo = _CountingUserRepository(user)
+    token = create_access_token({"sub": user.id, "role": user.role.value})
+    return AuthService(repo), repo, user, token
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_reuses_verified_user():
+    """Test a verified token is served from the cache afterwards."""
+    auth_service, repo, user, token = _auth_fixture()
+
+    first = await dependencies._resolve_user(token, auth_service)
+    second = await dependencies._resolve_user(token, auth_service)
+
+    assert first.id == second.id == user.id
+    assert repo.lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_shares_concurrent_lookups():
+    """Test concurrent misses for one token share a single lookup."""
+    auth_service, repo, user, token = _auth_fixture()
+
+    users = await asyncio.gather(*(
+        dependencies._resolve_user(token, auth_service) for _ in range(5)
+    ))
+
+    assert {resolved.id for resolved in users} == {user.id}
+    assert repo.lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_dropped_on_user_write():
+    """Test a user write makes the next request load the user again."""
+    auth_service, repo, user, token = _auth_fixture()
+
+    await dependencies._resolve_user(token, auth_service)
+    user_generations.bump(user.id)
+    await dependencies._resolve_user(token, auth_service)
+    await dependencies._resolve_user(token, auth_service)
+
+    assert repo.lookups == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_skips_failed_lookups():
+    """Test tokens for unknown users are rejected and not cached."""
+    auth_service, repo, _, _ = _auth_fixture()
+    token = create_access_token({"sub": str(ObjectId()), "role": "user"})
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            await dependencies._resolve_user(token, auth_service)
+        assert exc_info.value.status_code == 401
+
+    assert repo.lookups == 2
@@ -0,0 +1,152 @@
+"""
+Order service tests.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from bson import ObjectId
+
+from app.core.exceptions import ValidationError
+from app.infrastructure.repositories.order_repository import MongoOrderRepository
+from app.infrastructure.repositories.product_repository import MongoProductRepository
+from app.services.order_service import OrderService
+
+SHIPPING = {
+    "address": "1 Test Street",
+    "city": "Testville",
+    "country": "Testland",
+    "postal_code": "12345",
+    "phone_no": "5550100"
+}
+
+PAYMENT = {"id": "pi_test", "status": "succeeded"}
+
+
+class _RacingProductRepository(MongoProductRepository):
+    """Product repository where another buyer takes stock right after the check."""
+
+    def __init__(self, database, sold_elsewhere: dict):
+        super().__init__(database)
+        self._sold_elsewhere = sold_elsewhere
+
+    async def get_by_ids(self, product_ids):
+        products = await super().get_by_ids(product_ids)
+        while self._sold_elsewhere:
+            product_id, quantity = self._sold_elsewhere.popitem()
+            await self._collection.update_one(
+                {"_id": ObjectId(product_id)},
+                {"$inc": {"stock": -quantity}}
+            )
+        return products
+
+
+class _FailingOrderRepository(MongoOrderRepository):
+    """Order repository whose inserts fail."""
+
+    async def create(self, entity):
+        raise RuntimeError("insert failed")
+
+
+async def _insert_product(test_db, name: str, stock: int) -> str:
+    """Store a product and return its ID."""
+    result = await test_db.products.insert_one({
+        "name": name,
+        "price": 10,
+        "description": "Order test product",
+        "ratings": 0,
+        "images": [],
+        "category": "Electronics",
+        "seller": "Seller",
+        "stock": stock,
+        "num_of_reviews": 0,
+        "reviews": [],
+        "created_at": datetime.utcnow()
+    })
+    return str(result.inserted_id)
+
+
+def _order_items(*lines) -> list:
+    """Order item dicts for (product ID, quantity) pairs."""
+    return [
+        {"product": product_id, "name": "Item", "price": 10, "quantity": quantity, "image": "item.jpg"}
+        for product_id, quantity in lines
+    ]
+
+
+async def _place_order(service: OrderService, items: list):
+    """Place an order for the given items with fixed prices."""
+    return await service.create_order(
+        user_id="user1",
+        shipping_info=SHIPPING,
+        order_items=items,
+        items_price=Decimal("30"),
+        tax_price=Decimal("0"),
+        shipping_price=Decimal("0"),
+        payment_info=PAYMENT
+    )
+
+
+async def _stock(test_db, product_id: str) -> int:
+    """Current stored stock of a product."""
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    return product["stock"]
+
+
+@pytest.mark.asyncio
+async def test_create_order_reserves_stock(test_db):
+    """Test placing an order takes the ordered stock."""
+    first = await _insert_product(test_db, "First", 5)
+    second = await _insert_product(test_db, "Second", 3)
+    service = OrderService(MongoOrderRepository(test_db), MongoProductRepository(test_db))
+
+    await _place_order(service, _order_items((first, 2), (second, 1)))
+
+    assert await _stock(test_db, first) == 3
+    assert await _stock(test_db, second) == 2
+    assert await test_db.orders.count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_order_shortfall_rolls_back(test_db):
+    """Test a product selling out mid-order restores the others' stock."""
+    first = await _insert_product(test_db, "First", 5)
+    second = await _insert_product(test_db, "Second", 1)
+    service = OrderService(
+        MongoOrderRepository(test_db),
+        _RacingProductRepository(test_db, sold_elsewhere={second: 1})
+    )
+
+    with pytest.raises(ValidationError, match="Insufficient stock for Second"):
+        await _place_order(service, _order_items((first, 2), (second, 1)))
+
+    assert await _stock(test_db, first) == 5
+    assert await _stock(test_db, second) == 0
+    assert await test_db.orders.count_documents({}) == 0
+
+
+@pytest.mark.asyncio
+async def test_create_order_insert_failure_restores_stock(test_db):
+    """Test stock is put back when the order cannot be stored."""
+    first = await _insert_product(test_db, "First", 5)
+    service = OrderService(_FailingOrderRepository(test_db), MongoProductRepository(test_db))
+
+    with pytest.raises(RuntimeError):
+        await _place_order(service, _order_items((first, 2)))
+
+    assert await _stock(test_db, first) == 5
+    assert await test_db.orders.count_documents({}) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_order_restores_stock(test_db):
+    """Test cancelling an order returns its stock, repeated lines included."""
+    first = await _insert_product(test_db, "First", 5)
+    service = OrderService(MongoOrderRepository(test_db), MongoProductRepository(test_db))
+
+    order = await _place_order(service, _order_items((first, 2), (first, 1)))
+    assert await _stock(test_db, first) == 2
+
+    await service.cancel_order(order.id, "user1")
+
+    assert await _stock(test_db, first) == 5
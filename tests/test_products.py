@@ -1,9 +1,15 @@
 """
 Product endpoint tests.
 """
+from datetime import datetime
+
 import pytest
+from bson import ObjectId
 from httpx import AsyncClient
 
+from app.domain.products.entities import RECENT_REVIEW_CAP
+from app.infrastructure.repositories.product_repository import MongoProductRepository
+
 
 @pytest.mark.asyncio
 async def test_get_products(client: AsyncClient):
@@ -80,3 +86,162 @@ async def test_get_product_not_found(client: AsyncClient):
     response = await client.get("/api/v1/products/000000000000000000000000")
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_products_not_modified(client: AsyncClient):
+    """Test product list revalidation with If-None-Match."""
+    response = await client.get("/api/v1/products")
+
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        "/api/v1/products",
+        headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def _product_document(**overrides) -> dict:
+    """Stored product document for repository tests."""
+    document = {
+        "name": "Review Target",
+        "price": 10,
+        "description": "A product to review",
+        "ratings": 0,
+        "images": [],
+        "category": "Electronics",
+        "seller": "Seller",
+        "stock": 5,
+        "num_of_reviews": 0,
+        "rating_sum": 0,
+        "reviews": [],
+        "created_at": datetime.utcnow()
+    }
+    document.update(overrides)
+    return document
+
+
+@pytest.mark.asyncio
+async def test_add_review_new(test_db):
+    """Test a first review sets the running totals and is recorded."""
+    repo = MongoProductRepository(test_db)
+    product_id = str((await test_db.products.insert_one(_product_document())).inserted_id)
+
+    assert await repo.add_review(product_id, "user1", 4, "Good") is True
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == 1
+    assert product["rating_sum"] == 4
+    assert product["ratings"] == 4
+    assert [review["user"] for review in product["reviews"]] == ["user1"]
+    assert await test_db.product_reviews.count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_add_review_edit(test_db):
+    """Test a second review by the same user replaces the first."""
+    repo = MongoProductRepository(test_db)
+    product_id = str((await test_db.products.insert_one(_product_document())).inserted_id)
+
+    await repo.add_review(product_id, "user1", 4, "Good")
+    await repo.add_review(product_id, "user2", 5, "Great")
+    await repo.add_review(product_id, "user1", 2, "Changed my mind")
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == 2
+    assert product["rating_sum"] == 7
+    assert product["ratings"] == 3.5
+    assert [review["user"] for review in product["reviews"]] == ["user2", "user1"]
+    assert product["reviews"][-1]["comment"] == "Changed my mind"
+    assert await test_db.product_reviews.count_documents({}) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_review_caps_embedded_reviews(test_db):
+    """Test only the newest RECENT_REVIEW_CAP reviews stay embedded."""
+    repo = MongoProductRepository(test_db)
+    product_id = str((await test_db.products.insert_one(_product_document())).inserted_id)
+
+    for n in range(RECENT_REVIEW_CAP + 2):
+        await repo.add_review(product_id, f"user{n}", 5, "Fine")
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == RECENT_REVIEW_CAP + 2
+    assert product["rating_sum"] == 5 * (RECENT_REVIEW_CAP + 2)
+    assert len(product["reviews"]) == RECENT_REVIEW_CAP
+    assert product["reviews"][0]["user"] == "user2"
+
+
+@pytest.mark.asyncio
+async def test_remove_review(test_db):
+    """Test removing a review updates totals; unknown reviewers are a no-op."""
+    repo = MongoProductRepository(test_db)
+    product_id = str((await test_db.products.insert_one(_product_document())).inserted_id)
+
+    await repo.add_review(product_id, "user1", 4, "Good")
+    await repo.add_review(product_id, "user2", 2, "Meh")
+
+    assert await repo.remove_review(product_id, "user1") is True
+    assert await repo.remove_review(product_id, "nobody") is False
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == 1
+    assert product["rating_sum"] == 2
+    assert product["ratings"] == 2
+    assert [review["user"] for review in product["reviews"]] == ["user2"]
+    assert await test_db.product_reviews.count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_remove_review_outside_window(test_db):
+    """Test removing a review no longer embedded still updates totals."""
+    repo = MongoProductRepository(test_db)
+    product_id = str((await test_db.products.insert_one(_product_document())).inserted_id)
+
+    await repo.add_review(product_id, "oldest", 1, "Bad")
+    for n in range(RECENT_REVIEW_CAP):
+        await repo.add_review(product_id, f"user{n}", 5, "Fine")
+
+    assert await repo.remove_review(product_id, "oldest") is True
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == RECENT_REVIEW_CAP
+    assert product["rating_sum"] == 5 * RECENT_REVIEW_CAP
+    assert product["ratings"] == 5
+    assert len(product["reviews"]) == RECENT_REVIEW_CAP
+
+
+@pytest.mark.asyncio
+async def test_reviews_on_legacy_product(test_db):
+    """Test products stored without rating_sum use their embedded reviews."""
+    repo = MongoProductRepository(test_db)
+    document = _product_document(
+        ratings=3,
+        num_of_reviews=2,
+        reviews=[
+            {"user": "user1", "rating": 4, "comment": "Good"},
+            {"user": "user2", "rating": 2, "comment": "Meh"}
+        ]
+    )
+    del document["rating_sum"]
+    product_id = str((await test_db.products.insert_one(document)).inserted_id)
+
+    # Editing a review that exists only in the embedded array
+    await repo.add_review(product_id, "user1", 5, "Better")
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == 2
+    assert product["rating_sum"] == 7
+    assert product["ratings"] == 3.5
+
+    # Removing a review that was never in product_reviews
+    assert await repo.remove_review(product_id, "user2") is True
+
+    product = await test_db.products.find_one({"_id": ObjectId(product_id)})
+    assert product["num_of_reviews"] == 1
+    assert product["rating_sum"] == 5
+    assert product["ratings"] == 5
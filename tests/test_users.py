@@ -0,0 +1,71 @@
+"""
+User service tests.
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.core.exceptions import ValidationError
+from app.services.user_service import UserService, decode_user_cursor, encode_user_cursor
+
+
+def test_user_cursor_round_trip():
+    """Test a cursor decodes to the row position it was built from."""
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123000)
+    user_id = str(ObjectId())
+
+    cursor = encode_user_cursor({"created_at": created_at, "id": user_id})
+
+    assert decode_user_cursor(cursor) == (created_at, user_id)
+
+
+def test_user_cursor_without_created_at():
+    """Test rows missing created_at still round trip."""
+    user_id = str(ObjectId())
+
+    cursor = encode_user_cursor({"created_at": None, "id": user_id})
+
+    assert decode_user_cursor(cursor) == (None, user_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "MjAyNHx4eXo="])
+def test_user_cursor_malformed(cursor: str):
+    """Test malformed cursors are rejected as validation errors."""
+    with pytest.raises(ValidationError):
+        decode_user_cursor(cursor)
+
+
+class _BlockingUserRepository:
+    """User list queries that wait until released, counting calls."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.queries = 0
+
+    async def list_public_rows(self, skip: int, limit: int) -> list:
+        self.queries += 1
+        await self.release.wait()
+        return [{"id": str(ObjectId()), "created_at": None}] * limit
+
+    async def estimated_count(self) -> int:
+        return 100
+
+
+@pytest.mark.asyncio
+async def test_user_page_prefetch_skips_stale_rows():
+    """Test prefetches are deduplicated and do not cache rows read before a write."""
+    repo = _BlockingUserRepository()
+    service = UserService(repo)
+
+    service._prefetch_user_page(10, 10)
+    service._prefetch_user_page(10, 10)
+    await asyncio.sleep(0)
+
+    service._invalidate(str(ObjectId()))
+    repo.release.set()
+    await asyncio.gather(*service._prefetch_tasks.values())
+
+    assert repo.queries == 1
+    assert service._page_cache.get((10, 10)) is None